@@ -9,16 +9,66 @@ data into a compact format suitable for storage and API transmission.
 Requirements:
 - airtable-python-wrapper
 - python-dotenv
+- orjson (optional, falls back to ujson or the standard library json)
+- aiohttp (optional, only for compress_all_pending_async)
 - Environment variables: AIRTABLE_API_KEY, AIRTABLE_BASE_ID
 """
 
 import os
 import json
+import asyncio
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
 from dotenv import load_dotenv
 from airtable import Airtable
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Prefer orjson for the Compressed JSON blobs, falling back to ujson and then
+# the standard library when the faster encoders are not installed. The other
+# scripts import _json and _dumps from here.
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+
+
+def _dumps(data: Dict, indent: Optional[int] = None) -> str:
+    """Serialize to a compact JSON string, or pretty-printed when indent is given."""
+    if indent is not None:
+        return json.dumps(data, indent=indent, ensure_ascii=False)
+    # Every backend writes the same text as orjson: no spaces, and non-ASCII
+    # characters and slashes left unescaped
+    if _json is json:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+    if _json.__name__ == 'ujson':
+        return _json.dumps(data, ensure_ascii=False, escape_forward_slashes=False)
+    return _json.dumps(data).decode('utf-8')
+
+
+def _month_index(iso_date: str) -> int:
+    """Return year * 12 + month for an ISO date string."""
+    # Dates are stored as YYYY-MM-DD[...], so read the fields directly and
+    # only fall back to a full parse for anything else
+    if len(iso_date) >= 7 and iso_date[4] == '-':
+        return int(iso_date[:4]) * 12 + int(iso_date[5:7])
+    parsed = datetime.fromisoformat(iso_date.replace('Z', '+00:00'))
+    return parsed.year * 12 + parsed.month
+
 
 # Load environment variables
 load_dotenv()
@@ -34,130 +84,443 @@ if not API_KEY or not BASE_ID:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Concurrent applicants per batch; matches Airtable's 5 requests/sec per-base limit
+MAX_WORKERS = 5
+
+
+def _build_session() -> requests.Session:
+    """Build a keep-alive, gzip-enabled session that retries rate-limited calls."""
+    session = requests.Session()
+    session.headers.update({
+        'Authorization': f'Bearer {API_KEY}',
+        'Accept-Encoding': 'gzip'
+    })
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'PATCH', 'DELETE'])
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+    return session
+
+
+# Shared by every table handle so connections (and TLS sessions) are reused
+SESSION = _build_session()
+
+
+def open_table(table_name: str) -> Airtable:
+    """Open an Airtable table handle that uses the shared session."""
+    table = Airtable(BASE_ID, table_name, API_KEY)
+    table.session = SESSION
+    return table
+
+
+def fetch_linked_records(table: Airtable, record_ids: List[str], fields: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Fetch child records by ID from a parent's linked-record field.
+    
+    All IDs are read with one RECORD_ID() formula query rather than one get
+    per record, and returned in the order of the linked-record field.
+    """
+    if not record_ids:
+        return []
+    formula = "OR(" + ", ".join(f"RECORD_ID() = '{record_id}'" for record_id in record_ids) + ")"
+    records = {record['id']: record for record in table.get_all(formula=formula, fields=fields)}
+    return [records[record_id] for record_id in record_ids if record_id in records]
+
+# Applicants view filtered to AND({Compressed JSON} = '', {Personal Details} != '');
+# the formula is used directly if the view has not been created in the base
+PENDING_COMPRESSION_VIEW = 'Pending Compression'
+PENDING_COMPRESSION_FORMULA = "AND({Compressed JSON} = '', {Personal Details} != '')"
+
+# Child-table fields read during compression (plus the link used for indexing)
+PERSONAL_FIELDS = ['Full Name', 'Email', 'Location', 'LinkedIn', 'Applicant']
+EXPERIENCE_FIELDS = ['Company', 'Title', 'Start Date', 'End Date', 'Technologies',
+                     'Current Position', 'Applicant']
+SALARY_FIELDS = ['Preferred Rate', 'Minimum Rate', 'Currency', 'Availability', 'Applicant']
+
+# Compressed JSON layout: section -> (compressed key, child-table field, default).
+# The empty-technologies default is a tuple so entries never share a mutable list.
+CONTENT_SCHEMA = (
+    ('personal', (
+        ('name', 'Full Name', ''),
+        ('email', 'Email', ''),
+        ('location', 'Location', ''),
+        ('linkedin', 'LinkedIn', ''),
+    )),
+    ('experience', (
+        ('company', 'Company', ''),
+        ('title', 'Title', ''),
+        ('start', 'Start Date', ''),
+        ('end', 'End Date', ''),
+        ('technologies', 'Technologies', ()),
+        ('current', 'Current Position', False),
+    )),
+    ('salary', (
+        ('preferred_rate', 'Preferred Rate', 0),
+        ('minimum_rate', 'Minimum Rate', 0),
+        ('currency', 'Currency', 'USD'),
+        ('availability', 'Availability', 0),
+    )),
+)
+
+
+def _generate_content_builder():
+    """
+    Compile build_applicant_content from CONTENT_SCHEMA.
+    
+    The schema is fixed, so the builder is generated once as a single dict
+    literal with every .get() inlined, instead of looping over the mapping
+    for each applicant and experience entry.
+    """
+    def entries(source_var: str, mapping: tuple) -> str:
+        return ', '.join(f"{key!r}: {source_var}.get({field!r}, {default!r})" for key, field, default in mapping)
+    
+    schema = dict(CONTENT_SCHEMA)
+    source = (
+        "def build_applicant_content(personal_data, experience_data, salary_data):\n"
+        "    return {\n"
+        f"        'personal': {{{entries('personal_data', schema['personal'])}}},\n"
+        f"        'experience': [{{{entries('exp', schema['experience'])}}} for exp in experience_data],\n"
+        f"        'salary': {{{entries('salary_data', schema['salary'])}}}\n"
+        "    }\n"
+    )
+    namespace = {}
+    exec(compile(source, '<build_applicant_content>', 'exec'), namespace)
+    builder = namespace['build_applicant_content']
+    builder.__doc__ = "Build the personal/experience/salary sections of the compressed JSON from child-table fields."
+    return builder
+
+
+build_applicant_content = _generate_content_builder()
+
+
 class AirtableCompressor:
-    def __init__(self):
-        self.applicants_table = Airtable(BASE_ID, 'Applicants', API_KEY)
-        self.personal_table = Airtable(BASE_ID, 'Personal Details', API_KEY)
-        self.experience_table = Airtable(BASE_ID, 'Work Experience', API_KEY)
-        self.salary_table = Airtable(BASE_ID, 'Salary Preferences', API_KEY)
+    def __init__(self, indent: Optional[int] = None):
+        # Compressed JSON is machine-read, so it is stored compact unless an
+        # indent is requested for debugging
+        self.indent = indent
+        self.applicants_table = open_table('Applicants')
+        self.personal_table = open_table('Personal Details')
+        self.experience_table = open_table('Work Experience')
+        self.salary_table = open_table('Salary Preferences')
+        
+        # Child-table fields indexed by linked applicant ID, held only while a batch runs
+        self._personal_by_app: Optional[Dict[str, Dict]] = None
+        self._experience_by_app: Optional[Dict[str, List[Dict]]] = None
+        self._salary_by_app: Optional[Dict[str, Dict]] = None
 
-    def compress_applicant_data(self, applicant_id: str) -> Optional[Dict]:
+    def compress_applicant_data(self, applicant_id: str, personal: Optional[Dict] = None,
+                                experience: Optional[List[Dict]] = None,
+                                salary: Optional[Dict] = None,
+                                now_iso: Optional[str] = None) -> Optional[Dict]:
         """
         Compress all applicant data from linked tables into a single JSON object.
         
         Args:
             applicant_id: The Airtable record ID of the applicant
+            personal: Pre-fetched Personal Details fields (fetched if omitted)
+            experience: Pre-fetched Work Experience fields (fetched if omitted)
+            salary: Pre-fetched Salary Preferences fields (fetched if omitted)
+            now_iso: Timestamp shared across a batch (defaults to now)
             
         Returns:
             Dictionary containing the compressed JSON data
         """
         try:
-            logger.info(f"Starting compression for applicant {applicant_id}")
+            logger.debug("Starting compression for applicant %s", applicant_id)
+            
+            # Outside a batch, resolve children through the parent's linked-record
+            # IDs (direct gets by primary key) instead of loading whole tables
+            applicant_fields = None
+            if self._personal_by_app is None and any(data is None for data in (personal, experience, salary)):
+                applicant_fields = self.applicants_table.get(applicant_id)['fields']
             
-            # Fetch data from all linked tables
-            personal_data = self._fetch_personal_data(applicant_id)
-            experience_data = self._fetch_experience_data(applicant_id)
-            salary_data = self._fetch_salary_data(applicant_id)
+            # Fetch data from all linked tables unless the caller pre-fetched it
+            personal_data = personal if personal is not None else self._fetch_personal_data(applicant_id, applicant_fields)
+            experience_data = experience if experience is not None else self._fetch_experience_data(applicant_id, applicant_fields)
+            salary_data = salary if salary is not None else self._fetch_salary_data(applicant_id, applicant_fields)
             
             if not all([personal_data, salary_data]):
-                logger.error(f"Missing required data for applicant {applicant_id}")
+                logger.error("Missing required data for applicant %s", applicant_id)
                 return None
             
-            # Build compressed JSON structure
-            compressed_json = {
-                "personal": {
-                    "name": personal_data.get('Full Name', ''),
-                    "email": personal_data.get('Email', ''),
-                    "location": personal_data.get('Location', ''),
-                    "linkedin": personal_data.get('LinkedIn', '')
-                },
-                "experience": [
-                    {
-                        "company": exp.get('Company', ''),
-                        "title": exp.get('Title', ''),
-                        "start": exp.get('Start Date', ''),
-                        "end": exp.get('End Date', ''),
-                        "technologies": exp.get('Technologies', []),
-                        "current": exp.get('Current Position', False)
-                    } for exp in experience_data
-                ],
-                "salary": {
-                    "preferred_rate": salary_data.get('Preferred Rate', 0),
-                    "minimum_rate": salary_data.get('Minimum Rate', 0),
-                    "currency": salary_data.get('Currency', 'USD'),
-                    "availability": salary_data.get('Availability', 0)
-                },
-                "metadata": {
-                    "compressed_at": datetime.now().isoformat(),
-                    "version": "1.0"
-                }
-            }
+            if now_iso is None:
+                now_iso = datetime.now().isoformat()
             
             # Update the parent record with compressed JSON
-            json_string = json.dumps(compressed_json, indent=2)
-            self.applicants_table.update(applicant_id, {
-                'Compressed JSON': json_string,
-                'Last Compressed': datetime.now().isoformat()
-            })
+            compressed_json, parent_update = self._build_parent_update(personal_data, experience_data, salary_data, now_iso)
+            self.applicants_table.update(applicant_id, parent_update)
             
-            logger.info(f"Successfully compressed data for applicant {applicant_id}")
+            logger.info("Successfully compressed data for applicant %s", applicant_id)
             return compressed_json
             
-        except Exception as e:
-            logger.error(f"Failed to compress data for applicant {applicant_id}: {str(e)}")
+        except Exception:
+            logger.exception("Failed to compress data for applicant %s", applicant_id)
             raise
 
-    def _fetch_personal_data(self, applicant_id: str) -> Optional[Dict]:
+    def _build_parent_update(self, personal_data: Dict, experience_data: List[Dict],
+                             salary_data: Dict, now_iso: str) -> Tuple[Dict, Dict]:
+        """Build the compressed JSON and the Applicants fields that store it."""
+        content = build_applicant_content(personal_data, experience_data, salary_data)
+        compressed_json = {
+            **content,
+            "metadata": {
+                "compressed_at": now_iso,
+                "version": "1.0"
+            }
+        }
+        parent_update = {
+            'Compressed JSON': _dumps(compressed_json, self.indent),
+            'Last Compressed': now_iso
+        }
+        return compressed_json, parent_update
+
+    def _fetch_personal_data(self, applicant_id: str, applicant_fields: Optional[Dict] = None) -> Optional[Dict]:
         """Fetch personal details for the applicant."""
         try:
-            records = self.personal_table.search('Applicant', applicant_id)
-            if records:
-                return records[0]['fields']
-            return None
-        except Exception as e:
-            logger.error(f"Failed to fetch personal data: {str(e)}")
+            if applicant_fields is None:
+                return self._personal_index().get(applicant_id)
+            records = fetch_linked_records(self.personal_table, applicant_fields.get('Personal Details', [])[:1],
+                                           PERSONAL_FIELDS)
+            return records[0]['fields'] if records else None
+        except Exception:
+            logger.exception("Failed to fetch personal data")
             return None
 
-    def _fetch_experience_data(self, applicant_id: str) -> List[Dict]:
+    def _fetch_experience_data(self, applicant_id: str, applicant_fields: Optional[Dict] = None) -> List[Dict]:
         """Fetch all work experience records for the applicant."""
         try:
-            records = self.experience_table.search('Applicant', applicant_id)
+            if applicant_fields is None:
+                return self._experience_index().get(applicant_id, [])
+            records = fetch_linked_records(self.experience_table, applicant_fields.get('Work Experience', []),
+                                           EXPERIENCE_FIELDS)
             return [record['fields'] for record in records]
-        except Exception as e:
-            logger.error(f"Failed to fetch experience data: {str(e)}")
+        except Exception:
+            logger.exception("Failed to fetch experience data")
             return []
 
-    def _fetch_salary_data(self, applicant_id: str) -> Optional[Dict]:
+    def _fetch_salary_data(self, applicant_id: str, applicant_fields: Optional[Dict] = None) -> Optional[Dict]:
         """Fetch salary preferences for the applicant."""
         try:
-            records = self.salary_table.search('Applicant', applicant_id)
-            if records:
-                return records[0]['fields']
-            return None
-        except Exception as e:
-            logger.error(f"Failed to fetch salary data: {str(e)}")
+            if applicant_fields is None:
+                return self._salary_index().get(applicant_id)
+            records = fetch_linked_records(self.salary_table, applicant_fields.get('Salary Preferences', [])[:1],
+                                           SALARY_FIELDS)
+            return records[0]['fields'] if records else None
+        except Exception:
+            logger.exception("Failed to fetch salary data")
             return None
 
+    def _personal_index(self) -> Dict[str, Dict]:
+        """Personal Details fields by applicant ID, fetched with one get_all."""
+        if self._personal_by_app is None:
+            self._personal_by_app = self._index_by_applicant(self.personal_table.get_all(fields=PERSONAL_FIELDS))
+        return self._personal_by_app
+
+    def _experience_index(self) -> Dict[str, List[Dict]]:
+        """Work Experience fields by applicant ID, fetched with one get_all."""
+        if self._experience_by_app is None:
+            self._experience_by_app = self._group_by_applicant(self.experience_table.get_all(fields=EXPERIENCE_FIELDS))
+        return self._experience_by_app
+
+    def _salary_index(self) -> Dict[str, Dict]:
+        """Salary Preferences fields by applicant ID, fetched with one get_all."""
+        if self._salary_by_app is None:
+            self._salary_by_app = self._index_by_applicant(self.salary_table.get_all(fields=SALARY_FIELDS))
+        return self._salary_by_app
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached child-table indexes so the next lookup re-fetches them."""
+        self._personal_by_app = None
+        self._experience_by_app = None
+        self._salary_by_app = None
+
+    @staticmethod
+    def _index_by_applicant(records: List[Dict]) -> Dict[str, Dict]:
+        """Map each linked applicant ID to the fields of its (first) child record."""
+        index = {}
+        for record in records:
+            applicant_ids = record['fields'].get('Applicant')
+            if applicant_ids:
+                index.setdefault(applicant_ids[0], record['fields'])
+        return index
+
+    @staticmethod
+    def _group_by_applicant(records: List[Dict]) -> Dict[str, List[Dict]]:
+        """Map each linked applicant ID to the fields of all its child records."""
+        grouped = defaultdict(list)
+        for record in records:
+            applicant_ids = record['fields'].get('Applicant')
+            if applicant_ids:
+                grouped[applicant_ids[0]].append(record['fields'])
+        return grouped
+
     def compress_all_pending(self) -> None:
         """Compress data for all applicants without compressed JSON."""
         try:
             # Find all applicants without compressed JSON
-            formula = "AND({Compressed JSON} = '', {Personal Details} != '')"
-            pending_applicants = self.applicants_table.get_all(formula=formula)
-            
-            logger.info(f"Found {len(pending_applicants)} applicants pending compression")
-            
-            for applicant in pending_applicants:
-                applicant_id = applicant['id']
-                try:
-                    self.compress_applicant_data(applicant_id)
-                except Exception as e:
-                    logger.error(f"Failed to compress applicant {applicant_id}: {str(e)}")
-                    continue
+            try:
+                pending_applicants = self.applicants_table.get_all(view=PENDING_COMPRESSION_VIEW)
+            except HTTPError:
+                logger.warning("View '%s' unavailable, filtering by formula instead", PENDING_COMPRESSION_VIEW)
+                pending_applicants = self.applicants_table.get_all(formula=PENDING_COMPRESSION_FORMULA)
+            
+            logger.info("Found %s applicants pending compression", len(pending_applicants))
+            
+            # Fetch each linked table once (fresh for this batch) instead of
+            # searching it per applicant; loaded before the workers start
+            self.invalidate_cache()
+            personal_by_app = self._personal_index()
+            experience_by_app = self._experience_index()
+            salary_by_app = self._salary_index()
+            
+            # One timestamp for the whole batch
+            now_iso = datetime.now().isoformat()
+            
+            # Requests are network-bound, so overlap them across a small worker pool
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(
+                        self.compress_applicant_data,
+                        applicant['id'],
+                        personal=personal_by_app.get(applicant['id'], {}),
+                        experience=experience_by_app.get(applicant['id'], []),
+                        salary=salary_by_app.get(applicant['id'], {}),
+                        now_iso=now_iso
+                    ): applicant['id']
+                    for applicant in pending_applicants
+                }
+                
+                for future in as_completed(futures):
+                    applicant_id = futures[future]
+                    try:
+                        future.result()
+                    except Exception:
+                        logger.exception("Failed to compress applicant %s", applicant_id)
+                        continue
                     
-        except Exception as e:
-            logger.error(f"Failed to compress pending applicants: {str(e)}")
+        except Exception:
+            logger.exception("Failed to compress pending applicants")
             raise
+        finally:
+            # The indexes are a snapshot for this batch; later single-applicant
+            # calls go back to reading the live linked records
+            self.invalidate_cache()
+
+    async def compress_all_pending_async(self) -> None:
+        """
+        Async variant of compress_all_pending.
+        
+        Overlaps every request on one event loop through AsyncAirtableClient
+        instead of a thread pool; concurrency is still capped at MAX_WORKERS.
+        """
+        async with AsyncAirtableClient() as client:
+            try:
+                pending_applicants = await client.list_records('Applicants', view=PENDING_COMPRESSION_VIEW)
+            except aiohttp.ClientResponseError:
+                logger.warning("View '%s' unavailable, filtering by formula instead", PENDING_COMPRESSION_VIEW)
+                pending_applicants = await client.list_records('Applicants', filterByFormula=PENDING_COMPRESSION_FORMULA)
+            
+            logger.info("Found %s applicants pending compression", len(pending_applicants))
+            
+            # Fetch the three linked tables concurrently, once each
+            personal_records, experience_records, salary_records = await asyncio.gather(
+                client.list_records('Personal Details', fields=PERSONAL_FIELDS),
+                client.list_records('Work Experience', fields=EXPERIENCE_FIELDS),
+                client.list_records('Salary Preferences', fields=SALARY_FIELDS)
+            )
+            personal_by_app = self._index_by_applicant(personal_records)
+            experience_by_app = self._group_by_applicant(experience_records)
+            salary_by_app = self._index_by_applicant(salary_records)
+            
+            now_iso = datetime.now().isoformat()
+            results = await asyncio.gather(*[
+                self._compress_one(
+                    client,
+                    applicant['id'],
+                    personal_by_app.get(applicant['id'], {}),
+                    experience_by_app.get(applicant['id'], []),
+                    salary_by_app.get(applicant['id'], {}),
+                    now_iso
+                )
+                for applicant in pending_applicants
+            ], return_exceptions=True)
+            
+            for applicant, result in zip(pending_applicants, results):
+                if isinstance(result, Exception):
+                    logger.error("Failed to compress applicant %s", applicant['id'], exc_info=result)
+
+    async def _compress_one(self, client: 'AsyncAirtableClient', applicant_id: str, personal_data: Dict,
+                            experience_data: List[Dict], salary_data: Dict, now_iso: str) -> Optional[Dict]:
+        """Compress one applicant from pre-fetched child fields and PATCH the parent record."""
+        if not all([personal_data, salary_data]):
+            logger.error("Missing required data for applicant %s", applicant_id)
+            return None
+        
+        compressed_json, parent_update = self._build_parent_update(personal_data, experience_data, salary_data, now_iso)
+        await client.update_record('Applicants', applicant_id, parent_update)
+        
+        logger.info("Successfully compressed data for applicant %s", applicant_id)
+        return compressed_json
+
+
+class AsyncAirtableClient:
+    """
+    Minimal asyncio Airtable REST client.
+    
+    One pooled aiohttp session serves every table; a semaphore keeps at most
+    max_concurrency requests in flight, and 429 responses are retried with
+    exponential backoff.
+    """
+    
+    API_URL = 'https://api.airtable.com/v0'
+    MAX_RETRIES = 5
+    
+    def __init__(self, max_concurrency: int = MAX_WORKERS):
+        if aiohttp is None:
+            raise ImportError("AsyncAirtableClient requires aiohttp (pip install aiohttp)")
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session = None
+    
+    async def __aenter__(self) -> 'AsyncAirtableClient':
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10),
+            headers={'Authorization': f'Bearer {API_KEY}'}
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self._session.close()
+    
+    async def _request(self, method: str, table_name: str, path: str = '', **kwargs) -> Dict:
+        url = f"{self.API_URL}/{BASE_ID}/{quote(table_name)}{path}"
+        for attempt in range(self.MAX_RETRIES):
+            async with self._semaphore:
+                async with self._session.request(method, url, **kwargs) as response:
+                    if response.status != 429 or attempt == self.MAX_RETRIES - 1:
+                        response.raise_for_status()
+                        return await response.json(loads=_json.loads)
+            await asyncio.sleep(0.5 * 2 ** attempt)
+    
+    async def list_records(self, table_name: str, fields: Optional[List[str]] = None, **params) -> List[Dict]:
+        """Fetch every page of a table; params are Airtable query parameters (view, filterByFormula)."""
+        query = list(params.items()) + [('fields[]', field) for field in fields or []]
+        records = []
+        offset = None
+        while True:
+            page = await self._request('GET', table_name, params=query + ([('offset', offset)] if offset else []))
+            records.extend(page.get('records', []))
+            offset = page.get('offset')
+            if not offset:
+                return records
+    
+    async def update_record(self, table_name: str, record_id: str, fields: Dict) -> Dict:
+        """PATCH the given fields onto one record."""
+        return await self._request('PATCH', table_name, f'/{record_id}', json={'fields': fields})
 
 def main():
     """Main execution function."""
@@ -169,6 +532,9 @@ def main():
     
     # Option 2: Compress all pending applicants
     compressor.compress_all_pending()
+    
+    # Option 3: Same as option 2 on an asyncio event loop (requires aiohttp)
+    # asyncio.run(compressor.compress_all_pending_async())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
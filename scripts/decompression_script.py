@@ -9,16 +9,23 @@ data while maintaining referential integrity.
 Requirements:
 - airtable-python-wrapper
 - python-dotenv
+- orjson (optional, falls back to ujson or the standard library json)
 - Environment variables: AIRTABLE_API_KEY, AIRTABLE_BASE_ID
 """
 
 import os
-import json
 import logging
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 from dotenv import load_dotenv
 from airtable import Airtable
+from requests.exceptions import HTTPError
+from compression_script import (
+    PERSONAL_FIELDS, EXPERIENCE_FIELDS, SALARY_FIELDS, _json, fetch_linked_records, open_table
+)
 
 # Load environment variables
 load_dotenv()
@@ -34,56 +41,133 @@ if not API_KEY or not BASE_ID:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Concurrent applicants per batch; matches Airtable's 5 requests/sec per-base limit
+MAX_WORKERS = 5
+
+# Applicants view filtered on a 'Needs Decompression' formula field wrapping the
+# formula below (view filters cannot compare two fields); the formula is used
+# directly if the view has not been created in the base
+MODIFIED_APPLICANTS_VIEW = 'Modified Since Decompression'
+MODIFIED_APPLICANTS_FORMULA = ("AND({Compressed JSON} != '', OR({Last Decompressed} = '', "
+                               "{Last Compressed} > {Last Decompressed}))")
+
+# Child-table columns and the compressed JSON keys they must equal, pairwise
+PERSONAL_COLUMNS = ('Full Name', 'Email', 'Location', 'LinkedIn')
+PERSONAL_KEYS = ('name', 'email', 'location', 'linkedin')
+SALARY_COLUMNS = ('Preferred Rate', 'Minimum Rate', 'Currency', 'Availability')
+SALARY_KEYS = ('preferred_rate', 'minimum_rate', 'currency', 'availability')
+
 class AirtableDecompressor:
     def __init__(self):
-        self.applicants_table = Airtable(BASE_ID, 'Applicants', API_KEY)
-        self.personal_table = Airtable(BASE_ID, 'Personal Details', API_KEY)
-        self.experience_table = Airtable(BASE_ID, 'Work Experience', API_KEY)
-        self.salary_table = Airtable(BASE_ID, 'Salary Preferences', API_KEY)
+        self.applicants_table = open_table('Applicants')
+        self.personal_table = open_table('Personal Details')
+        self.experience_table = open_table('Work Experience')
+        self.salary_table = open_table('Salary Preferences')
+        
+        # Child-table records grouped by linked applicant ID, loaded by batch runs
+        self._personal_by_app: Optional[Dict[str, List[Dict]]] = None
+        self._experience_by_app: Optional[Dict[str, List[Dict]]] = None
+        self._salary_by_app: Optional[Dict[str, List[Dict]]] = None
+        
+        # Parent records by ID, so a validate_data_integrity call straight after
+        # decompress_applicant_data reuses its fetch. The cache only spans that
+        # pair: each decompression starts from a fresh fetch, and validation or
+        # any failure clears it, so a stale Compressed JSON is never restored.
+        self._get_applicant = lru_cache(maxsize=1024)(self.applicants_table.get)
 
-    def decompress_applicant_data(self, applicant_id: str) -> bool:
+    def decompress_applicant_data(self, applicant_id: str, defer_parent_update: bool = False) -> bool:
         """
         Decompress JSON data and update all linked tables.
         
         Args:
             applicant_id: The Airtable record ID of the applicant
+            defer_parent_update: Skip the 'Last Decompressed' write so the
+                caller can batch it with other applicants
             
         Returns:
             True if decompression was successful, False otherwise
         """
         try:
-            logger.info(f"Starting decompression for applicant {applicant_id}")
+            logger.debug("Starting decompression for applicant %s", applicant_id)
             
-            # Get compressed JSON from parent table
-            applicant_record = self.applicants_table.get(applicant_id)
+            # Get compressed JSON from parent table, never from an earlier call
+            self._get_applicant.cache_clear()
+            applicant_record = self._get_applicant(applicant_id)
             if not applicant_record or 'Compressed JSON' not in applicant_record['fields']:
-                logger.error(f"No compressed JSON found for applicant {applicant_id}")
+                logger.error("No compressed JSON found for applicant %s", applicant_id)
                 return False
             
-            compressed_data = json.loads(applicant_record['fields']['Compressed JSON'])
+            compressed_data = _json.loads(applicant_record['fields']['Compressed JSON'])
             
             # Update each linked table
-            self._update_personal_details(applicant_id, compressed_data.get('personal', {}))
-            self._update_work_experience(applicant_id, compressed_data.get('experience', []))
-            self._update_salary_preferences(applicant_id, compressed_data.get('salary', {}))
+            applicant_fields = applicant_record['fields']
+            self._restore_tables(applicant_id, applicant_fields, compressed_data)
             
             # Update last decompressed timestamp
-            self.applicants_table.update(applicant_id, {
-                'Last Decompressed': datetime.now().isoformat()
-            })
+            if not defer_parent_update:
+                self._mark_decompressed(applicant_id, applicant_fields)
             
-            logger.info(f"Successfully decompressed data for applicant {applicant_id}")
+            logger.info("Successfully decompressed data for applicant %s", applicant_id)
             return True
             
-        except Exception as e:
-            logger.error(f"Failed to decompress data for applicant {applicant_id}: {str(e)}")
+        except Exception:
+            logger.exception("Failed to decompress data for applicant %s", applicant_id)
+            self._get_applicant.cache_clear()
             return False
 
-    def _update_personal_details(self, applicant_id: str, personal_data: Dict) -> None:
+    def decompress_and_validate(self, applicant_id: str) -> Dict[str, bool]:
+        """
+        Decompress JSON data into the linked tables, then validate the result.
+        
+        Parses the Compressed JSON once for both steps; prefer this over calling
+        decompress_applicant_data and validate_data_integrity back to back.
+        
+        Args:
+            applicant_id: The Airtable record ID of the applicant
+            
+        Returns:
+            Dictionary with validation results for each table
+        """
+        try:
+            self._get_applicant.cache_clear()
+            applicant_record = self._get_applicant(applicant_id)
+            if not applicant_record or 'Compressed JSON' not in applicant_record['fields']:
+                logger.error("No compressed JSON found for applicant %s", applicant_id)
+                return {'error': 'No compressed JSON found'}
+            
+            compressed_data = _json.loads(applicant_record['fields']['Compressed JSON'])
+            
+            applicant_fields = applicant_record['fields']
+            self._restore_tables(applicant_id, applicant_fields, compressed_data)
+            self._mark_decompressed(applicant_id, applicant_fields)
+            logger.info("Successfully decompressed data for applicant %s", applicant_id)
+            
+            return self._validate_compressed(applicant_id, applicant_fields, compressed_data)
+            
+        except Exception as e:
+            logger.exception("Failed to decompress and validate applicant %s", applicant_id)
+            return {'error': str(e)}
+        finally:
+            self._get_applicant.cache_clear()
+
+    def _restore_tables(self, applicant_id: str, applicant_fields: Dict, compressed_data: Dict) -> None:
+        """Write each section of the parsed JSON back to its linked table."""
+        self._update_personal_details(applicant_id, compressed_data.get('personal', {}), applicant_fields)
+        self._update_work_experience(applicant_id, compressed_data.get('experience', []), applicant_fields)
+        self._update_salary_preferences(applicant_id, compressed_data.get('salary', {}), applicant_fields)
+
+    def _mark_decompressed(self, applicant_id: str, applicant_fields: Dict) -> None:
+        """Stamp 'Last Decompressed' on the parent record (and its cached copy)."""
+        parent_update = {'Last Decompressed': datetime.now().isoformat()}
+        self.applicants_table.update(applicant_id, parent_update)
+        applicant_fields.update(parent_update)
+
+    def _update_personal_details(self, applicant_id: str, personal_data: Dict,
+                                 applicant_fields: Optional[Dict] = None) -> None:
         """Update or create personal details record."""
         try:
             # Check if record exists
-            existing_records = self.personal_table.search('Applicant', applicant_id)
+            existing_ids = self._existing_ids(applicant_id, applicant_fields, 'Personal Details', self._personal_index)
             
             update_data = {
                 'Full Name': personal_data.get('name', ''),
@@ -93,53 +177,71 @@ class AirtableDecompressor:
                 'Applicant': [applicant_id]
             }
             
-            if existing_records:
+            if existing_ids:
                 # Update existing record
-                record_id = existing_records[0]['id']
-                self.personal_table.update(record_id, update_data)
-                logger.info(f"Updated personal details for applicant {applicant_id}")
+                record_id = existing_ids[0]
+                record = self.personal_table.update(record_id, update_data)
+                logger.debug("Updated personal details for applicant %s", applicant_id)
             else:
                 # Create new record
-                self.personal_table.create(update_data)
-                logger.info(f"Created personal details for applicant {applicant_id}")
+                record = self.personal_table.insert(update_data)
+                logger.debug("Created personal details for applicant %s", applicant_id)
+            
+            # Keep the cached index and parent record in step with what was just written
+            if self._personal_by_app is not None:
+                self._personal_by_app[applicant_id] = [record]
+            if applicant_fields is not None:
+                applicant_fields['Personal Details'] = [record['id']]
                 
-        except Exception as e:
-            logger.error(f"Failed to update personal details: {str(e)}")
+        except Exception:
+            logger.exception("Failed to update personal details")
             raise
 
-    def _update_work_experience(self, applicant_id: str, experience_data: List[Dict]) -> None:
+    def _update_work_experience(self, applicant_id: str, experience_data: List[Dict],
+                                applicant_fields: Optional[Dict] = None) -> None:
         """Update work experience records, replacing all existing ones."""
         try:
-            # Delete existing experience records
-            existing_records = self.experience_table.search('Applicant', applicant_id)
-            for record in existing_records:
-                self.experience_table.delete(record['id'])
-            
-            # Create new experience records
-            for exp in experience_data:
-                create_data = {
+            existing_ids = self._existing_ids(applicant_id, applicant_fields, 'Work Experience', self._experience_index)
+            
+            # Insert the new experience records (batched 10 per request); the link
+            # list is only serialized, so every record can share one instance
+            applicant_link = [applicant_id]
+            create_records = [
+                {
                     'Company': exp.get('company', ''),
                     'Title': exp.get('title', ''),
                     'Start Date': exp.get('start', ''),
-                    'End Date': exp.get('end', '') if not exp.get('current', False) else '',
+                    'End Date': '' if exp.get('current', False) else exp.get('end', ''),
                     'Technologies': exp.get('technologies', []),
                     'Current Position': exp.get('current', False),
-                    'Applicant': [applicant_id]
-                }
-                
-                self.experience_table.create(create_data)
+                    'Applicant': applicant_link
+                } for exp in experience_data
+            ]
+            created_records = self.experience_table.batch_insert(create_records) if create_records else []
             
-            logger.info(f"Updated {len(experience_data)} experience records for applicant {applicant_id}")
+            # Only delete the old records once their replacements exist, so a
+            # failed insert leaves the applicant's experience in place
+            if existing_ids:
+                self.experience_table.batch_delete(existing_ids)
             
-        except Exception as e:
-            logger.error(f"Failed to update work experience: {str(e)}")
+            # Keep the cached index and parent record in step with what was just written
+            if self._experience_by_app is not None:
+                self._experience_by_app[applicant_id] = created_records
+            if applicant_fields is not None:
+                applicant_fields['Work Experience'] = [record['id'] for record in created_records]
+            
+            logger.debug("Updated %s experience records for applicant %s", len(experience_data), applicant_id)
+            
+        except Exception:
+            logger.exception("Failed to update work experience")
             raise
 
-    def _update_salary_preferences(self, applicant_id: str, salary_data: Dict) -> None:
+    def _update_salary_preferences(self, applicant_id: str, salary_data: Dict,
+                                   applicant_fields: Optional[Dict] = None) -> None:
         """Update or create salary preferences record."""
         try:
             # Check if record exists
-            existing_records = self.salary_table.search('Applicant', applicant_id)
+            existing_ids = self._existing_ids(applicant_id, applicant_fields, 'Salary Preferences', self._salary_index)
             
             update_data = {
                 'Preferred Rate': salary_data.get('preferred_rate', 0),
@@ -149,40 +251,136 @@ class AirtableDecompressor:
                 'Applicant': [applicant_id]
             }
             
-            if existing_records:
+            if existing_ids:
                 # Update existing record
-                record_id = existing_records[0]['id']
-                self.salary_table.update(record_id, update_data)
-                logger.info(f"Updated salary preferences for applicant {applicant_id}")
+                record_id = existing_ids[0]
+                record = self.salary_table.update(record_id, update_data)
+                logger.debug("Updated salary preferences for applicant %s", applicant_id)
             else:
                 # Create new record
-                self.salary_table.create(update_data)
-                logger.info(f"Created salary preferences for applicant {applicant_id}")
+                record = self.salary_table.insert(update_data)
+                logger.debug("Created salary preferences for applicant %s", applicant_id)
+            
+            # Keep the cached index and parent record in step with what was just written
+            if self._salary_by_app is not None:
+                self._salary_by_app[applicant_id] = [record]
+            if applicant_fields is not None:
+                applicant_fields['Salary Preferences'] = [record['id']]
                 
-        except Exception as e:
-            logger.error(f"Failed to update salary preferences: {str(e)}")
+        except Exception:
+            logger.exception("Failed to update salary preferences")
             raise
 
+    @staticmethod
+    def _group_by_applicant(records: List[Dict]) -> Dict[str, List[Dict]]:
+        """Map each linked applicant ID to all of its child records."""
+        grouped = defaultdict(list)
+        for record in records:
+            applicant_ids = record['fields'].get('Applicant')
+            if applicant_ids:
+                grouped[applicant_ids[0]].append(record)
+        return grouped
+
+    def _personal_index(self) -> Dict[str, List[Dict]]:
+        """Personal Details records by applicant ID, fetched with one get_all."""
+        if self._personal_by_app is None:
+            self._personal_by_app = self._group_by_applicant(self.personal_table.get_all(fields=PERSONAL_FIELDS))
+        return self._personal_by_app
+
+    def _experience_index(self) -> Dict[str, List[Dict]]:
+        """Work Experience records by applicant ID, fetched with one get_all."""
+        if self._experience_by_app is None:
+            self._experience_by_app = self._group_by_applicant(self.experience_table.get_all(fields=EXPERIENCE_FIELDS))
+        return self._experience_by_app
+
+    def _salary_index(self) -> Dict[str, List[Dict]]:
+        """Salary Preferences records by applicant ID, fetched with one get_all."""
+        if self._salary_by_app is None:
+            self._salary_by_app = self._group_by_applicant(self.salary_table.get_all(fields=SALARY_FIELDS))
+        return self._salary_by_app
+
+    def _uses_index(self, applicant_fields: Optional[Dict]) -> bool:
+        """Whether child lookups go through the cached indexes (loaded together by batches)."""
+        return applicant_fields is None or self._personal_by_app is not None
+
+    def _existing_ids(self, applicant_id: str, applicant_fields: Optional[Dict], link_field: str,
+                      index: Callable[[], Dict[str, List[Dict]]]) -> List[str]:
+        """
+        IDs of the applicant's current records in one child table: from the cached
+        index during batches, otherwise straight from the parent's linked-record field.
+        """
+        if self._uses_index(applicant_fields):
+            return [record['id'] for record in index().get(applicant_id, [])]
+        return list(applicant_fields.get(link_field, []))
+
+    def _linked_records(self, applicant_id: str, applicant_fields: Optional[Dict], link_field: str,
+                        index: Callable[[], Dict[str, List[Dict]]], table: Airtable,
+                        fields: List[str]) -> List[Dict]:
+        """The applicant's records in one child table, fetched by ID in one request outside batches."""
+        if self._uses_index(applicant_fields):
+            return index().get(applicant_id, [])
+        return fetch_linked_records(table, applicant_fields.get(link_field, []), fields)
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached child-table indexes so the next lookup re-fetches them."""
+        self._personal_by_app = None
+        self._experience_by_app = None
+        self._salary_by_app = None
+        self._get_applicant.cache_clear()
+
     def decompress_all_modified(self) -> None:
         """Decompress all applicants where JSON is newer than last decompression."""
         try:
             # Find applicants with compressed JSON that haven't been decompressed
-            formula = "AND({Compressed JSON} != '', OR({Last Decompressed} = '', {Last Compressed} > {Last Decompressed}))"
-            modified_applicants = self.applicants_table.get_all(formula=formula)
-            
-            logger.info(f"Found {len(modified_applicants)} applicants requiring decompression")
-            
-            for applicant in modified_applicants:
-                applicant_id = applicant['id']
-                try:
-                    self.decompress_applicant_data(applicant_id)
-                except Exception as e:
-                    logger.error(f"Failed to decompress applicant {applicant_id}: {str(e)}")
-                    continue
+            try:
+                modified_applicants = self.applicants_table.get_all(view=MODIFIED_APPLICANTS_VIEW)
+            except HTTPError:
+                logger.warning("View '%s' unavailable, filtering by formula instead", MODIFIED_APPLICANTS_VIEW)
+                modified_applicants = self.applicants_table.get_all(formula=MODIFIED_APPLICANTS_FORMULA)
+            
+            logger.info("Found %s applicants requiring decompression", len(modified_applicants))
+            
+            # Fetch each linked table once (fresh for this batch) before the
+            # workers start, instead of searching it per applicant
+            self.invalidate_cache()
+            self._personal_index()
+            self._experience_index()
+            self._salary_index()
+            
+            # One timestamp for the whole batch
+            now_iso = datetime.now().isoformat()
+            
+            # Requests are network-bound, so overlap them across a small worker pool
+            parent_updates = []
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self.decompress_applicant_data, applicant['id'], defer_parent_update=True): applicant['id']
+                    for applicant in modified_applicants
+                }
+                
+                for future in as_completed(futures):
+                    applicant_id = futures[future]
+                    try:
+                        if future.result():
+                            parent_updates.append({
+                                'id': applicant_id,
+                                'fields': {'Last Decompressed': now_iso}
+                            })
+                    except Exception:
+                        logger.exception("Failed to decompress applicant %s", applicant_id)
+                        continue
+            
+            # Write all 'Last Decompressed' timestamps in batched requests
+            if parent_updates:
+                self.applicants_table.batch_update(parent_updates)
                     
-        except Exception as e:
-            logger.error(f"Failed to decompress modified applicants: {str(e)}")
+        except Exception:
+            logger.exception("Failed to decompress modified applicants")
             raise
+        finally:
+            # The indexes are a snapshot for this batch; later single-applicant
+            # calls go back to reading the live linked records
+            self.invalidate_cache()
 
     def validate_data_integrity(self, applicant_id: str) -> Dict[str, bool]:
         """
@@ -193,76 +391,72 @@ class AirtableDecompressor:
         """
         try:
             # Get the compressed JSON
-            applicant_record = self.applicants_table.get(applicant_id)
+            applicant_record = self._get_applicant(applicant_id)
             if not applicant_record or 'Compressed JSON' not in applicant_record['fields']:
                 return {'error': 'No compressed JSON found'}
             
-            compressed_data = json.loads(applicant_record['fields']['Compressed JSON'])
-            
-            # Validate each table
-            results = {
-                'personal': self._validate_personal_data(applicant_id, compressed_data.get('personal', {})),
-                'experience': self._validate_experience_data(applicant_id, compressed_data.get('experience', [])),
-                'salary': self._validate_salary_data(applicant_id, compressed_data.get('salary', {}))
-            }
-            
-            return results
+            compressed_data = _json.loads(applicant_record['fields']['Compressed JSON'])
+            return self._validate_compressed(applicant_id, applicant_record['fields'], compressed_data)
             
         except Exception as e:
-            logger.error(f"Failed to validate data integrity: {str(e)}")
+            logger.exception("Failed to validate data integrity")
             return {'error': str(e)}
+        finally:
+            # The record was only cached for this validation
+            self._get_applicant.cache_clear()
+
+    def _validate_compressed(self, applicant_id: str, applicant_fields: Dict,
+                             compressed_data: Dict) -> Dict[str, bool]:
+        """Validate the linked tables against already-parsed compressed JSON."""
+        # Fetch the live child rows once for all three checks
+        personal_records = self._linked_records(applicant_id, applicant_fields, 'Personal Details',
+                                                self._personal_index, self.personal_table, PERSONAL_FIELDS)
+        experience_records = self._linked_records(applicant_id, applicant_fields, 'Work Experience',
+                                                  self._experience_index, self.experience_table, EXPERIENCE_FIELDS)
+        salary_records = self._linked_records(applicant_id, applicant_fields, 'Salary Preferences',
+                                              self._salary_index, self.salary_table, SALARY_FIELDS)
+        
+        # Validate each table
+        results = {
+            'personal': self._validate_personal_data(personal_records, compressed_data.get('personal', {})),
+            'experience': self._validate_experience_data(experience_records, compressed_data.get('experience', [])),
+            'salary': self._validate_salary_data(salary_records, compressed_data.get('salary', {}))
+        }
+        
+        return results
 
-    def _validate_personal_data(self, applicant_id: str, expected_data: Dict) -> bool:
+    def _validate_personal_data(self, records: List[Dict], expected_data: Dict) -> bool:
         """Validate personal details against expected data."""
         try:
-            records = self.personal_table.search('Applicant', applicant_id)
             if not records:
                 return False
             
             actual_data = records[0]['fields']
-            return (
-                actual_data.get('Full Name') == expected_data.get('name') and
-                actual_data.get('Email') == expected_data.get('email') and
-                actual_data.get('Location') == expected_data.get('location') and
-                actual_data.get('LinkedIn') == expected_data.get('linkedin')
-            )
+            return tuple(map(actual_data.get, PERSONAL_COLUMNS)) == tuple(map(expected_data.get, PERSONAL_KEYS))
         except:
             return False
 
-    def _validate_experience_data(self, applicant_id: str, expected_data: List[Dict]) -> bool:
+    def _validate_experience_data(self, records: List[Dict], expected_data: List[Dict]) -> bool:
         """Validate experience records against expected data."""
         try:
-            records = self.experience_table.search('Applicant', applicant_id)
             if len(records) != len(expected_data):
                 return False
             
-            # Sort both by company name for comparison
-            actual_sorted = sorted(records, key=lambda x: x['fields'].get('Company', ''))
-            expected_sorted = sorted(expected_data, key=lambda x: x.get('company', ''))
-            
-            for actual, expected in zip(actual_sorted, expected_sorted):
-                if (actual['fields'].get('Company') != expected.get('company') or
-                    actual['fields'].get('Title') != expected.get('title')):
-                    return False
-            
-            return True
+            # Compare (company, title) pairs as multisets; no sorting needed
+            actual_pairs = Counter((r['fields'].get('Company'), r['fields'].get('Title')) for r in records)
+            expected_pairs = Counter((e.get('company'), e.get('title')) for e in expected_data)
+            return actual_pairs == expected_pairs
         except:
             return False
 
-    def _validate_salary_data(self, applicant_id: str, expected_data: Dict) -> bool:
+    def _validate_salary_data(self, records: List[Dict], expected_data: Dict) -> bool:
         """Validate salary preferences against expected data."""
         try:
-            records = self.salary_table.search('Applicant', applicant_id)
             if not records:
                 return False
             
             actual_data = records[0]['fields']
-            return (
-                actual_data.get('Preferred Rate') == expected_data.get('preferred_rate') and
-                actual_data.get('Minimum Rate') == expected_data.get('minimum_rate') and
-                actual_data.get('Currency') == expected_data.get('currency') and
-                actual_data.get('Availability') == expected_data.get('availability')
-            )
+            return tuple(map(actual_data.get, SALARY_COLUMNS)) == tuple(map(expected_data.get, SALARY_KEYS))
         except:
             return False
 
@@ -270,12 +464,10 @@ def main():
     """Main execution function."""
     decompressor = AirtableDecompressor()
     
-    # Option 1: Decompress specific applicant
+    # Option 1: Decompress and validate specific applicant
     # applicant_id = "rec1234567890"  # Replace with actual record ID
-    # success = decompressor.decompress_applicant_data(applicant_id)
-    # if success:
-    #     validation = decompressor.validate_data_integrity(applicant_id)
-    #     print(f"Validation results: {validation}")
+    # validation = decompressor.decompress_and_validate(applicant_id)
+    # print(f"Validation results: {validation}")
     
     # Option 2: Decompress all modified applicants
     decompressor.decompress_all_modified()
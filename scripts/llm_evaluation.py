@@ -7,24 +7,40 @@ and enrich applicant profiles. It provides qualitative assessment, scoring,
 and generates follow-up questions for promising candidates.
 
 Requirements:
-- openai>=1.0.0
+- openai>=1.40.0
 - tenacity
 - python-dotenv
 - airtable-python-wrapper
+- orjson (optional, falls back to ujson or the standard library json)
+- h2 (optional, enables HTTP/2 for OpenAI requests)
 - Environment variables: AIRTABLE_API_KEY, AIRTABLE_BASE_ID, OPENAI_API_KEY
 """
 
 import os
-import json
+import re
+import asyncio
 import logging
+import time
+import sqlite3
 import hashlib
+import tempfile
+import threading
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
-from airtable import Airtable
+from compression_script import _dumps, _json, _month_index, open_table
 from tenacity import retry, stop_after_attempt, wait_exponential
+import httpx
 import openai
 
+# httpx only speaks HTTP/2 when the h2 package is installed
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -42,56 +58,430 @@ logger = logging.getLogger(__name__)
 
 # LLM Configuration
 MAX_TOKENS_PER_CALL = 500
-MODEL_NAME = "gpt-4"
+MODEL_NAME = "gpt-4o"
 TEMPERATURE = 0.3
 
+# Maximum applicants evaluated concurrently (each holds one OpenAI request)
+MAX_CONCURRENT_EVALUATIONS = 10
+
+# Companies called out as notable in the prompt context, matched by whole word
+TOP_COMPANIES = frozenset({'google', 'meta', 'facebook', 'microsoft', 'amazon', 'apple'})
+COMPANY_WORD_RE = re.compile(r'[a-z]+')
+
+# Shared connection pool for OpenAI requests
+OPENAI_TIMEOUT_SECONDS = 60.0
+OPENAI_CONNECT_RETRIES = 3
+
+# OpenAI account limits shared by all concurrent evaluations
+OPENAI_REQUESTS_PER_MINUTE = 500
+OPENAI_TOKENS_PER_MINUTE = 30000
+# Rough prompt size estimate; the response headers correct any drift
+CHARS_PER_TOKEN = 4
+
+# Records buffered between the Airtable page fetcher and the evaluation workers
+PENDING_QUEUE_SIZE = 100
+
+# OpenAI Batch API settings for bulk backlog evaluation
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL_SECONDS = 30
+BATCH_TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+# Airtable accepts at most 10 records per batch write
+AIRTABLE_BATCH_SIZE = 10
+
+# How long a full Applicants read is reused for statistics, in memory and on disk
+RECORDS_CACHE_TTL_SECONDS = 60
+CACHE_DB_PATH = os.getenv(
+    'LLM_CACHE_DB',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'llm_cache.db')
+)
+RECORDS_CACHE_KEY = 'Applicants:stats'
+
+# Only request the Applicants columns each path actually reads
+EVALUATION_INPUT_FIELDS = ['Compressed JSON', 'LLM Summary', 'Last JSON Hash']
+STATISTICS_FIELDS = ['LLM Summary', 'LLM Score']
+
+# Placeholder evaluation written when the LLM response cannot be parsed
+PARSE_FAILURE_RESULT = {
+    'summary': 'Error parsing LLM response',
+    'score': 5,
+    'issues': ['LLM evaluation failed'],
+    'follow_ups': ['Please review application manually']
+}
+
+# Airtable table sharing LLM results across hosts: primary field 'Hash' holds
+# the evaluation cache key, 'Result' the evaluation as JSON
+EVAL_CACHE_TABLE = 'Eval Cache'
+EVAL_CACHE_FIELDS = ['Hash', 'Result']
+
+# Structured-output schema the LLM must answer with
+EVALUATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "applicant_evaluation",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "summary": {"type": "string"},
+                "score": {"type": "integer"},
+                "issues": {"type": "array", "items": {"type": "string"}},
+                "follow_ups": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["summary", "score", "issues", "follow_ups"],
+            "additionalProperties": False
+        }
+    }
+}
+
+class RateLimiter:
+    """
+    Token bucket tracking both the request and token budgets of an OpenAI account.
+    
+    Workers wait in acquire() until both buckets can cover a call, instead of
+    hitting 429s and sleeping through tenacity backoff. After each response the
+    buckets are pulled down to what the x-ratelimit-remaining-* headers report,
+    which also accounts for other clients sharing the same key.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.max_requests = float(requests_per_minute)
+        self.max_tokens = float(tokens_per_minute)
+        self.available_requests = self.max_requests
+        self.available_tokens = self.max_tokens
+        self.last_refill = time.monotonic()
+        # Created on first use so it belongs to the running event loop
+        self._lock = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed_minutes = (now - self.last_refill) / 60
+        self.last_refill = now
+        self.available_requests = min(self.max_requests, self.available_requests + elapsed_minutes * self.max_requests)
+        self.available_tokens = min(self.max_tokens, self.available_tokens + elapsed_minutes * self.max_tokens)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and the given number of tokens are available."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        tokens = min(tokens, self.max_tokens)
+        
+        # Holding the lock while waiting keeps callers first-come, first-served
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.available_requests >= 1 and self.available_tokens >= tokens:
+                    self.available_requests -= 1
+                    self.available_tokens -= tokens
+                    return
+                wait_minutes = max(
+                    (1 - self.available_requests) / self.max_requests,
+                    (tokens - self.available_tokens) / self.max_tokens
+                )
+                await asyncio.sleep(max(wait_minutes * 60, 0.05))
+
+    def update_from_headers(self, headers) -> None:
+        """Lower the buckets to the remaining budget reported by the API."""
+        try:
+            remaining_requests = headers.get('x-ratelimit-remaining-requests')
+            remaining_tokens = headers.get('x-ratelimit-remaining-tokens')
+            if remaining_requests is not None:
+                self.available_requests = min(self.available_requests, float(remaining_requests))
+            if remaining_tokens is not None:
+                self.available_tokens = min(self.available_tokens, float(remaining_tokens))
+        except ValueError:
+            logger.warning("Ignoring malformed OpenAI rate-limit headers")
+
 class LLMEvaluator:
     def __init__(self):
-        self.applicants_table = Airtable(BASE_ID, 'Applicants', API_KEY)
-        self.openai_client = openai.OpenAI(api_key=OPENAI_API_KEY)
+        # Shares the keep-alive, retrying session used by the compression scripts
+        self.applicants_table = open_table('Applicants')
+        self.openai_client = openai.AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            http_client=self._build_http_client()
+        )
+        self.rate_limiter = RateLimiter(OPENAI_REQUESTS_PER_MINUTE, OPENAI_TOKENS_PER_MINUTE)
+        self.eval_cache_table = open_table(EVAL_CACHE_TABLE)
+        # (fetched_at, records) for the last full Applicants read
+        self._records_cache = None
+        # Eval Cache contents by key, loaded once for bulk runs
+        self._shared_evaluations = None
+        # Eval Cache rows waiting to be created
+        self._pending_shared_evaluations = []
+        # Local cache database, opened on first use and shared by the worker
+        # threads that run every cache access off the event loop
+        self._cache_db = None
+        self._cache_db_lock = threading.Lock()
 
-    def evaluate_all_pending(self) -> None:
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """
+        Build the pooled HTTP client used for every OpenAI request.
+        
+        With HTTP/2 the concurrent evaluations multiplex over one TLS
+        connection instead of each holding its own HTTP/1.1 connection.
+        """
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            retries=OPENAI_CONNECT_RETRIES,
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_EVALUATIONS,
+                max_keepalive_connections=MAX_CONCURRENT_EVALUATIONS
+            )
+        )
+        return httpx.AsyncClient(transport=transport, timeout=OPENAI_TIMEOUT_SECONDS)
+
+    async def evaluate_all_pending(self) -> None:
         """Evaluate all applicants with compressed JSON but no LLM evaluation."""
         try:
-            # Find applicants needing LLM evaluation
+            # Find applicants needing LLM evaluation, streamed one page at a time
             formula = "AND({Compressed JSON} != '', {LLM Summary} = '')"
-            pending_applicants = self.applicants_table.get_all(formula=formula)
+            pages = self.applicants_table.get_iter(formula=formula, fields=EVALUATION_INPUT_FIELDS)
+            
+            # Evaluations are I/O-bound, so a fixed pool of workers runs them
+            # concurrently while the next page is fetched. The bounded queue
+            # keeps only about one page of records in memory.
+            # Results are queued and written back in batches of AIRTABLE_BATCH_SIZE.
+            queue = asyncio.Queue(maxsize=PENDING_QUEUE_SIZE)
+            pending_updates = []
+            outcomes = Counter()
+            
+            # One read of the shared cache serves every lookup in this run
+            await asyncio.to_thread(self._load_shared_evaluations)
+            
+            producer = asyncio.create_task(self._enqueue_pages(pages, queue))
+            workers = [asyncio.create_task(self._evaluate_from_queue(queue, pending_updates, outcomes))
+                       for _ in range(MAX_CONCURRENT_EVALUATIONS)]
+            try:
+                # A failed fetch still queues the stop markers, so the workers
+                # finish the applicants already queued before its error is raised
+                await asyncio.gather(*workers)
+                await producer
+            except BaseException:
+                # Stop whatever is still running; unfinished applicants keep an
+                # empty LLM Summary and are picked up again next run
+                for task in (producer, *workers):
+                    task.cancel()
+                await asyncio.gather(producer, *workers, return_exceptions=True)
+                raise
+            finally:
+                # Write the results already evaluated, even if the run failed
+                await self._flush_updates(pending_updates, flush_all=True)
+            
+            logger.info(f"LLM evaluation complete: {outcomes['successful']} successful, {outcomes['failed']} failed")
             
-            logger.info(f"Found {len(pending_applicants)} applicants needing LLM evaluation")
+        except Exception as e:
+            logger.error(f"Failed to evaluate pending applicants: {str(e)}")
+            raise
+
+    async def _enqueue_pages(self, pages, queue: asyncio.Queue) -> None:
+        """Feed records from a blocking page iterator into the worker queue."""
+        cancelled = False
+        try:
+            while True:
+                page = await asyncio.to_thread(next, pages, None)
+                if page is None:
+                    break
+                logger.info(f"Fetched page of {len(page)} applicants needing LLM evaluation")
+                for applicant in page:
+                    await queue.put(applicant)
+        except asyncio.CancelledError:
+            # Cancelled along with the workers, which then need no stop markers
+            cancelled = True
+            raise
+        finally:
+            # One stop marker per worker, even if fetching failed
+            if not cancelled:
+                for _ in range(MAX_CONCURRENT_EVALUATIONS):
+                    await queue.put(None)
+
+    async def _evaluate_from_queue(self, queue: asyncio.Queue, pending_updates: List[Dict],
+                                   outcomes: Counter) -> None:
+        """Worker: evaluate queued applicants until a stop marker arrives."""
+        while True:
+            applicant = await queue.get()
+            if applicant is None:
+                return
+            
+            # The formula already excludes evaluated records, so skip the hash
+            # check, and the scanned record already carries the JSON, so skip the GET
+            try:
+                success = await self.evaluate_applicant(
+                    applicant['id'], force=True, pending_updates=pending_updates, record=applicant
+                )
+            except Exception as e:
+                logger.error(f"Failed to evaluate applicant {applicant['id']}: {str(e)}")
+                success = False
+            
+            outcomes['successful' if success else 'failed'] += 1
+            await self._flush_updates(pending_updates)
+
+    async def evaluate_all_pending_batch(self) -> None:
+        """
+        Evaluate all pending applicants through the OpenAI Batch API.
+
+        Submits one JSONL file covering the whole backlog instead of one
+        online request per applicant, at half the token price. Results can
+        take up to the completion window to arrive, so this is meant for
+        bulk runs rather than interactive use.
+        """
+        try:
+            formula = "AND({Compressed JSON} != '', {LLM Summary} = '')"
+            pending_applicants = await asyncio.to_thread(
+                self.applicants_table.get_all, formula=formula, fields=EVALUATION_INPUT_FIELDS
+            )
+            
+            if not pending_applicants:
+                logger.info("No applicants need LLM evaluation")
+                return
             
             successful_evaluations = 0
             failed_evaluations = 0
+            pending_updates = []
             
-            for applicant in pending_applicants:
-                applicant_id = applicant['id']
-                try:
-                    success = self.evaluate_applicant(applicant_id)
-                    if success:
+            await asyncio.to_thread(self._load_shared_evaluations)
+            
+            # Keep the source JSON per applicant so results can be hashed on write
+            compressed_by_id = {}
+            with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as batch_file:
+                for applicant in pending_applicants:
+                    compressed_json = applicant['fields']['Compressed JSON']
+                    
+                    # Profiles evaluated before need no batch line
+                    cached_result = await asyncio.to_thread(self._find_cached_evaluation, compressed_json)
+                    if cached_result:
+                        pending_updates.append(
+                            self._build_update_record(applicant['id'], cached_result, compressed_json)
+                        )
                         successful_evaluations += 1
-                    else:
-                        failed_evaluations += 1
-                        
+                        continue
+                    
+                    try:
+                        applicant_data = _json.loads(compressed_json)
+                    except ValueError as e:
+                        logger.error(f"Skipping applicant {applicant['id']} with invalid JSON: {str(e)}")
+                        continue
+                    compressed_by_id[applicant['id']] = compressed_json
+                    line = {
+                        "custom_id": applicant['id'],
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": self._build_chat_request(applicant_data, compressed_json)
+                    }
+                    batch_file.write(_dumps(line) + '\n')
+                batch_path = batch_file.name
+            
+            await self._flush_updates(pending_updates, flush_all=True)
+            
+            if not compressed_by_id:
+                os.remove(batch_path)
+                logger.info(f"All {successful_evaluations} pending applicants were served from the LLM cache")
+                return
+            
+            try:
+                with open(batch_path, 'rb') as f:
+                    input_file = await self.openai_client.files.create(file=f, purpose="batch")
+            finally:
+                os.remove(batch_path)
+            
+            batch = await self.openai_client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window=BATCH_COMPLETION_WINDOW
+            )
+            logger.info(f"Submitted batch {batch.id} with {len(compressed_by_id)} applicants")
+            
+            while batch.status not in BATCH_TERMINAL_STATUSES:
+                await asyncio.sleep(BATCH_POLL_INTERVAL_SECONDS)
+                batch = await self.openai_client.batches.retrieve(batch.id)
+            
+            if batch.status != 'completed':
+                logger.error(f"Batch {batch.id} finished with status {batch.status}")
+                return
+            
+            # Successful requests land in the output file and failed ones in the
+            # error file; either may be absent
+            result_lines = []
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id:
+                    result_file = await self.openai_client.files.content(file_id)
+                    result_lines.extend(result_file.text.splitlines())
+            
+            for raw_line in result_lines:
+                if not raw_line.strip():
+                    continue
+                line = _json.loads(raw_line)
+                applicant_id = line['custom_id']
+                response = line.get('response') or {}
+                
+                if line.get('error') or response.get('status_code') != 200:
+                    error = line.get('error') or (response.get('body') or {}).get('error')
+                    logger.error(f"Batch evaluation failed for applicant {applicant_id}: {error}")
+                    failed_evaluations += 1
+                    continue
+                
+                try:
+                    content = response['body']['choices'][0]['message']['content']
+                    evaluation_result = self._parse_llm_response(content)
+                    await asyncio.to_thread(self._remember_evaluation, compressed_by_id[applicant_id], evaluation_result)
+                    pending_updates.append(
+                        self._build_update_record(applicant_id, evaluation_result, compressed_by_id[applicant_id])
+                    )
+                    successful_evaluations += 1
                 except Exception as e:
-                    logger.error(f"Failed to evaluate applicant {applicant_id}: {str(e)}")
+                    logger.error(f"Failed to apply batch result for applicant {applicant_id}: {str(e)}")
                     failed_evaluations += 1
                     continue
+                
+                await self._flush_updates(pending_updates)
+            
+            await self._flush_updates(pending_updates, flush_all=True)
             
-            logger.info(f"LLM evaluation complete: {successful_evaluations} successful, {failed_evaluations} failed")
+            logger.info(f"Batch LLM evaluation complete: {successful_evaluations} successful, {failed_evaluations} failed")
             
         except Exception as e:
-            logger.error(f"Failed to evaluate pending applicants: {str(e)}")
+            logger.error(f"Failed to run batch evaluation: {str(e)}")
             raise
 
+    async def _flush_updates(self, pending_updates: List[Dict], flush_all: bool = False) -> None:
+        """Write queued evaluation results once a full Airtable batch is ready."""
+        while len(pending_updates) >= AIRTABLE_BATCH_SIZE or (flush_all and pending_updates):
+            # Take the batch before awaiting so concurrent flushes never overlap
+            batch = pending_updates[:AIRTABLE_BATCH_SIZE]
+            del pending_updates[:AIRTABLE_BATCH_SIZE]
+            await asyncio.to_thread(self.applicants_table.batch_update, batch)
+            await asyncio.to_thread(self._invalidate_records_cache)
+            logger.info(f"Wrote LLM evaluation results for {len(batch)} applicants")
+        
+        await self._flush_shared_evaluations(flush_all)
+
+    async def _flush_shared_evaluations(self, flush_all: bool = False) -> None:
+        """Create queued Eval Cache rows once a full Airtable batch is ready."""
+        pending = self._pending_shared_evaluations
+        while len(pending) >= AIRTABLE_BATCH_SIZE or (flush_all and pending):
+            batch = pending[:AIRTABLE_BATCH_SIZE]
+            del pending[:AIRTABLE_BATCH_SIZE]
+            # The shared cache is an optimisation; losing a write only costs a future LLM call
+            try:
+                await asyncio.to_thread(self.eval_cache_table.batch_insert, batch)
+            except Exception as e:
+                logger.warning(f"Failed to write {len(batch)} rows to {EVAL_CACHE_TABLE}: {str(e)}")
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10)
     )
-    def evaluate_applicant(self, applicant_id: str) -> bool:
+    async def evaluate_applicant(self, applicant_id: str, force: bool = False,
+                                 pending_updates: Optional[List[Dict]] = None,
+                                 record: Optional[Dict] = None) -> bool:
         """
         Evaluate a single applicant using LLM.
         
         Args:
             applicant_id: The Airtable record ID of the applicant
+            force: Skip the up-to-date check; a cached result for the same JSON is still reused
+            pending_updates: If given, queue the result here for a later
+                batch write instead of updating the record immediately
+            record: The applicant record if the caller already fetched it
             
         Returns:
             True if evaluation was successful, False otherwise
@@ -99,8 +489,8 @@ class LLMEvaluator:
         try:
             logger.info(f"Starting LLM evaluation for applicant {applicant_id}")
             
-            # Get applicant data
-            applicant_record = self.applicants_table.get(applicant_id)
+            # Get applicant data (the Airtable client is blocking, so run it off the event loop)
+            applicant_record = record or await asyncio.to_thread(self.applicants_table.get, applicant_id)
             if not applicant_record or 'Compressed JSON' not in applicant_record['fields']:
                 logger.error(f"No compressed JSON found for applicant {applicant_id}")
                 return False
@@ -108,20 +498,31 @@ class LLMEvaluator:
             compressed_json = applicant_record['fields']['Compressed JSON']
             
             # Check if evaluation is needed (JSON hasn't changed)
-            if not self._needs_evaluation(applicant_id, compressed_json):
+            if not force and not self._needs_evaluation(applicant_record, compressed_json):
                 logger.info(f"Applicant {applicant_id} already has up-to-date LLM evaluation")
                 return True
             
-            # Parse the compressed data
-            applicant_data = json.loads(compressed_json)
-            
-            # Generate LLM evaluation
-            evaluation_result = self._call_llm_api(applicant_data)
-            if not evaluation_result:
-                return False
-            
-            # Update the applicant record
-            self._update_applicant_record(applicant_id, evaluation_result, compressed_json)
+            # Reuse a stored result if this exact JSON was evaluated before
+            evaluation_result = await asyncio.to_thread(self._find_cached_evaluation, compressed_json)
+            if evaluation_result:
+                logger.info(f"Using cached LLM evaluation for applicant {applicant_id}")
+            else:
+                # Parse the compressed data
+                applicant_data = _json.loads(compressed_json)
+                
+                # Generate LLM evaluation
+                evaluation_result = await self._call_llm_api(applicant_data, compressed_json)
+                if not evaluation_result:
+                    return False
+                await asyncio.to_thread(self._remember_evaluation, compressed_json, evaluation_result)
+                if pending_updates is None:
+                    await self._flush_shared_evaluations(flush_all=True)
+            
+            # Update the applicant record, or queue it for the caller's batch write
+            if pending_updates is not None:
+                pending_updates.append(self._build_update_record(applicant_id, evaluation_result, compressed_json))
+            else:
+                await asyncio.to_thread(self._update_applicant_record, applicant_id, evaluation_result, compressed_json)
             
             logger.info(f"Successfully completed LLM evaluation for applicant {applicant_id}")
             return True
@@ -130,45 +531,54 @@ class LLMEvaluator:
             logger.error(f"Failed LLM evaluation for applicant {applicant_id}: {str(e)}")
             raise
 
-    def _needs_evaluation(self, applicant_id: str, current_json: str) -> bool:
-        """Check if the applicant needs a new LLM evaluation."""
+    def _needs_evaluation(self, applicant_record: Dict, current_json: str) -> bool:
+        """Check if the already-fetched applicant record needs a new LLM evaluation."""
         try:
-            applicant_record = self.applicants_table.get(applicant_id)
-            
             # If no previous evaluation, evaluation is needed
             if not applicant_record['fields'].get('LLM Summary'):
                 return True
             
             # Check if JSON has changed since last evaluation
             last_json_hash = applicant_record['fields'].get('Last JSON Hash', '')
-            current_json_hash = self._hash_json(current_json)
+            if last_json_hash == self._hash_json(current_json):
+                return False
             
-            return last_json_hash != current_json_hash
+            # Records evaluated before the switch to BLAKE2 still carry an MD5 hash
+            return last_json_hash != self._legacy_hash_json(current_json)
             
         except Exception as e:
             logger.warning(f"Failed to check if evaluation needed: {str(e)}")
             return True  # Default to needing evaluation
 
-    def _call_llm_api(self, applicant_data: Dict) -> Optional[Dict]:
+    def _build_chat_request(self, applicant_data: Dict, compressed_json: str) -> Dict:
+        """Build the chat-completion request body shared by online and batch calls."""
+        return {
+            "model": MODEL_NAME,
+            "messages": [
+                {
+                    "role": "system", 
+                    "content": "You are a skilled recruiting analyst with expertise in evaluating technical contractor profiles. Provide clear, actionable insights."
+                },
+                {
+                    "role": "user",
+                    "content": self._build_evaluation_prompt(applicant_data, compressed_json)
+                }
+            ],
+            "max_tokens": MAX_TOKENS_PER_CALL,
+            "temperature": TEMPERATURE,
+            "response_format": EVALUATION_RESPONSE_FORMAT
+        }
+
+    async def _call_llm_api(self, applicant_data: Dict, compressed_json: str) -> Optional[Dict]:
         """Make API call to LLM for evaluation."""
         try:
-            prompt = self._build_evaluation_prompt(applicant_data)
-            
-            response = self.openai_client.chat.completions.create(
-                model=MODEL_NAME,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are a skilled recruiting analyst with expertise in evaluating technical contractor profiles. Provide clear, actionable insights."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=MAX_TOKENS_PER_CALL,
-                temperature=TEMPERATURE
-            )
+            request = self._build_chat_request(applicant_data, compressed_json)
+            prompt_chars = sum(len(message['content']) for message in request['messages'])
+            await self.rate_limiter.acquire(prompt_chars // CHARS_PER_TOKEN + MAX_TOKENS_PER_CALL)
+            
+            raw_response = await self.openai_client.chat.completions.with_raw_response.create(**request)
+            self.rate_limiter.update_from_headers(raw_response.headers)
+            response = raw_response.parse()
             
             result = self._parse_llm_response(response.choices[0].message.content)
             
@@ -182,19 +592,21 @@ class LLMEvaluator:
             logger.error(f"LLM API call failed: {str(e)}")
             return None
 
-    def _build_evaluation_prompt(self, applicant_data: Dict) -> str:
-        """Build the evaluation prompt for the LLM."""
+    def _build_evaluation_prompt(self, applicant_data: Dict, compressed_json: str) -> str:
+        """
+        Build the evaluation prompt for the LLM.
+        
+        The parsed data feeds the context lines; the profile itself is embedded
+        as the stored compact JSON string rather than re-serialized.
+        """
         personal = applicant_data.get('personal', {})
         experience = applicant_data.get('experience', [])
         salary = applicant_data.get('salary', {})
         
         # Calculate some metrics for context
         total_experience = self._calculate_experience_years(experience)
-        top_companies = [exp.get('company', '') for exp in experience 
-                        if any(tier in exp.get('company', '').lower() 
-                              for tier in ['google', 'meta', 'facebook', 'microsoft', 'amazon', 'apple'])]
-        
-        json_str = json.dumps(applicant_data, indent=2)
+        top_companies = [exp.get('company', '') for exp in experience
+                         if not TOP_COMPANIES.isdisjoint(COMPANY_WORD_RE.findall(exp.get('company', '').lower()))]
         
         prompt = f"""You are a recruiting analyst reviewing contractor applications. 
 Given this JSON applicant profile, please provide four specific deliverables:
@@ -205,7 +617,7 @@ Given this JSON applicant profile, please provide four specific deliverables:
    - Company background and career progression  
    - Rate competitiveness and availability
    - Overall profile completeness
-3. List any data gaps or inconsistencies you notice (or 'None' if profile is complete)
+3. List any data gaps or inconsistencies you notice (empty if the profile is complete)
 4. Suggest up to three follow-up questions to better assess the candidate
 
 Context:
@@ -215,66 +627,33 @@ Context:
 - Located in {personal.get('location', 'Unknown')}
 
 Candidate Profile JSON:
-{json_str}
+{compressed_json}
 
-Please return exactly in this format:
-Summary: [Exactly 75 words summarizing key qualifications, experience, and value proposition]
-Score: [Integer from 1-10]
-Issues: [Comma-separated list of gaps/inconsistencies or 'None']
-Follow-Ups:
-• [Specific question about technical capabilities]
-• [Question about availability/project preferences] 
-• [Question to clarify any gaps or validate claims]"""
+Respond with a JSON object with these keys:
+- "summary": exactly 75 words summarizing key qualifications, experience, and value proposition
+- "score": integer from 1-10
+- "issues": list of gaps/inconsistencies (empty list if none)
+- "follow_ups": up to three questions covering technical capabilities, availability/project preferences, and any gaps or claims to validate"""
 
         return prompt
 
     def _parse_llm_response(self, response_text: str) -> Dict:
-        """Parse the LLM response into structured data."""
+        """Parse the LLM's structured JSON response."""
         try:
-            lines = response_text.strip().split('\n')
+            parsed = _json.loads(response_text)
+            
             result = {
-                'summary': '',
-                'score': 5,
-                'issues': [],
-                'follow_ups': []
+                'summary': ' '.join(str(parsed.get('summary', '')).split()),
+                'score': parsed.get('score', 5),
+                'issues': [
+                    issue.strip() for issue in parsed.get('issues') or []
+                    if issue.strip().lower() not in ['none', 'n/a', '']
+                ],
+                'follow_ups': [q.strip() for q in parsed.get('follow_ups') or [] if q.strip()]
             }
             
-            current_section = None
-            
-            for line in lines:
-                line = line.strip()
-                
-                if line.startswith('Summary:'):
-                    result['summary'] = line.replace('Summary:', '').strip()
-                    current_section = 'summary'
-                    
-                elif line.startswith('Score:'):
-                    try:
-                        score_text = line.replace('Score:', '').strip()
-                        result['score'] = int(score_text)
-                        if result['score'] < 1 or result['score'] > 10:
-                            result['score'] = 5  # Default to middle score
-                    except ValueError:
-                        result['score'] = 5
-                    current_section = 'score'
-                    
-                elif line.startswith('Issues:'):
-                    issues_text = line.replace('Issues:', '').strip()
-                    if issues_text.lower() not in ['none', 'n/a', '']:
-                        result['issues'] = [issue.strip() for issue in issues_text.split(',')]
-                    current_section = 'issues'
-                    
-                elif line.startswith('Follow-Ups:'):
-                    current_section = 'follow_ups'
-                    
-                elif line.startswith('•') and current_section == 'follow_ups':
-                    question = line.replace('•', '').strip()
-                    if question:
-                        result['follow_ups'].append(question)
-                        
-                elif current_section == 'summary' and line and not any(line.startswith(x) for x in ['Score:', 'Issues:', 'Follow-Ups:']):
-                    # Handle multi-line summaries
-                    result['summary'] += ' ' + line
+            if not isinstance(result['score'], int) or result['score'] < 1 or result['score'] > 10:
+                result['score'] = 5  # Default to middle score
             
             # Validate summary length (approximately 75 words)
             summary_words = len(result['summary'].split())
@@ -289,16 +668,12 @@ Follow-Ups:
             
         except Exception as e:
             logger.error(f"Failed to parse LLM response: {str(e)}")
-            return {
-                'summary': 'Error parsing LLM response',
-                'score': 5,
-                'issues': ['LLM evaluation failed'],
-                'follow_ups': ['Please review application manually']
-            }
+            return dict(PARSE_FAILURE_RESULT)
 
     def _calculate_experience_years(self, experience_data: List[Dict]) -> float:
         """Calculate total years of experience."""
         total_months = 0
+        now_month = None
         
         for exp in experience_data:
             try:
@@ -309,38 +684,46 @@ Follow-Ups:
                 if not start_date:
                     continue
                 
-                start = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+                start = _month_index(start_date)
                 
                 if is_current:
-                    end = datetime.now()
+                    if now_month is None:
+                        today = datetime.now()
+                        now_month = today.year * 12 + today.month
+                    end = now_month
                 elif end_date:
-                    end = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+                    end = _month_index(end_date)
                 else:
                     continue
                 
-                months = (end.year - start.year) * 12 + (end.month - start.month)
-                total_months += max(0, months)
+                total_months += max(0, end - start)
                 
             except Exception:
                 continue
         
         return round(total_months / 12, 1)
 
+    def _build_update_record(self, applicant_id: str, evaluation_result: Dict, compressed_json: str) -> Dict:
+        """Build the Airtable update payload for an applicant's LLM evaluation results."""
+        json_hash = self._hash_json(compressed_json)
+        
+        update_data = {
+            'LLM Summary': evaluation_result['summary'],
+            'LLM Score': evaluation_result['score'],
+            'LLM Follow-Ups': '\n'.join(['• ' + q for q in evaluation_result['follow_ups']]),
+            'LLM Issues': ', '.join(evaluation_result['issues']) if evaluation_result['issues'] else 'None',
+            'LLM Evaluation Date': datetime.now().isoformat(),
+            'Last JSON Hash': json_hash
+        }
+        
+        return {'id': applicant_id, 'fields': update_data}
+
     def _update_applicant_record(self, applicant_id: str, evaluation_result: Dict, compressed_json: str) -> None:
         """Update the applicant record with LLM evaluation results."""
         try:
-            json_hash = self._hash_json(compressed_json)
-            
-            update_data = {
-                'LLM Summary': evaluation_result['summary'],
-                'LLM Score': evaluation_result['score'],
-                'LLM Follow-Ups': '\n'.join(['• ' + q for q in evaluation_result['follow_ups']]),
-                'LLM Issues': ', '.join(evaluation_result['issues']) if evaluation_result['issues'] else 'None',
-                'LLM Evaluation Date': datetime.now().isoformat(),
-                'Last JSON Hash': json_hash
-            }
-            
-            self.applicants_table.update(applicant_id, update_data)
+            record = self._build_update_record(applicant_id, evaluation_result, compressed_json)
+            self.applicants_table.update(applicant_id, record['fields'])
+            self._invalidate_records_cache()
             logger.info(f"Updated applicant {applicant_id} with LLM evaluation results")
             
         except Exception as e:
@@ -349,16 +732,190 @@ Follow-Ups:
 
     def _hash_json(self, json_string: str) -> str:
         """Create a hash of the JSON string to detect changes."""
+        return hashlib.blake2b(json_string.encode(), digest_size=16).hexdigest()
+
+    def _legacy_hash_json(self, json_string: str) -> str:
+        """MD5 hash written by earlier versions of this script."""
         return hashlib.md5(json_string.encode()).hexdigest()
 
+    def _cache_connection(self) -> sqlite3.Connection:
+        """
+        Return the evaluator's cache database connection, opening it and
+        creating its tables on first use. Callers hold _cache_db_lock.
+        """
+        if self._cache_db is None:
+            # Accessed from asyncio.to_thread workers, serialized by the lock
+            conn = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+            conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS airtable_cache (key TEXT PRIMARY KEY, value TEXT, ts REAL);
+                CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, result TEXT, ts REAL);
+            """)
+            self._cache_db = conn
+        return self._cache_db
+
+    def close(self) -> None:
+        """Close the local cache database connection."""
+        with self._cache_db_lock:
+            if self._cache_db is not None:
+                self._cache_db.close()
+                self._cache_db = None
+
+    async def aclose(self) -> None:
+        """Close the pooled OpenAI HTTP client and the local cache database."""
+        try:
+            await self.openai_client.close()
+        finally:
+            self.close()
+
+    def _evaluation_cache_key(self, compressed_json: str) -> str:
+        """Key LLM results on the model and the exact profile JSON it saw."""
+        return f"{MODEL_NAME}:{self._hash_json(compressed_json)}"
+
+    def _get_cached_evaluation(self, compressed_json: str) -> Optional[Dict]:
+        """Return a stored LLM result for this profile JSON, if one exists."""
+        try:
+            with self._cache_db_lock:
+                row = self._cache_connection().execute(
+                    "SELECT result FROM llm_cache WHERE key = ?", (self._evaluation_cache_key(compressed_json),)
+                ).fetchone()
+            return _json.loads(row[0]) if row else None
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read LLM cache: {str(e)}")
+            return None
+
+    def _store_cached_evaluation(self, compressed_json: str, evaluation_result: Dict) -> None:
+        """Remember an LLM result so identical profile JSON is never re-sent."""
+        # Unparseable responses should be retried next time, not replayed
+        if evaluation_result == PARSE_FAILURE_RESULT:
+            return
+        try:
+            with self._cache_db_lock, self._cache_connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, result, ts) VALUES (?, ?, ?)",
+                    (self._evaluation_cache_key(compressed_json), _dumps(evaluation_result), time.time())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write LLM cache: {str(e)}")
+
+    def _get_all_cached(self) -> List[Dict]:
+        """
+        Return every applicant record (statistics fields only), reusing a recent read when possible.
+        
+        Checks the in-process copy first, then the on-disk copy shared with
+        other runs, and only pages through Airtable when both are older than
+        RECORDS_CACHE_TTL_SECONDS.
+        """
+        now = time.time()
+        if self._records_cache and now - self._records_cache[0] < RECORDS_CACHE_TTL_SECONDS:
+            return self._records_cache[1]
+        
+        try:
+            with self._cache_db_lock:
+                row = self._cache_connection().execute(
+                    "SELECT value, ts FROM airtable_cache WHERE key = ?", (RECORDS_CACHE_KEY,)
+                ).fetchone()
+            if row and now - row[1] < RECORDS_CACHE_TTL_SECONDS:
+                records = _json.loads(row[0])
+                self._records_cache = (row[1], records)
+                return records
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read records cache: {str(e)}")
+        
+        records = self.applicants_table.get_all(fields=STATISTICS_FIELDS)
+        self._records_cache = (now, records)
+        
+        try:
+            with self._cache_db_lock, self._cache_connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO airtable_cache (key, value, ts) VALUES (?, ?, ?)",
+                    (RECORDS_CACHE_KEY, _dumps(records), now)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write records cache: {str(e)}")
+        
+        return records
+
+    def _find_cached_evaluation(self, compressed_json: str) -> Optional[Dict]:
+        """Look up a prior result in the local cache, then the shared Eval Cache table."""
+        evaluation_result = self._get_cached_evaluation(compressed_json)
+        if evaluation_result:
+            return evaluation_result
+        
+        evaluation_result = self._get_shared_evaluation(compressed_json)
+        if evaluation_result:
+            self._store_cached_evaluation(compressed_json, evaluation_result)
+        return evaluation_result
+
+    def _remember_evaluation(self, compressed_json: str, evaluation_result: Dict) -> None:
+        """Store a fresh result locally and queue it for the shared Eval Cache table."""
+        self._store_cached_evaluation(compressed_json, evaluation_result)
+        if evaluation_result == PARSE_FAILURE_RESULT:
+            return
+        
+        key = self._evaluation_cache_key(compressed_json)
+        self._pending_shared_evaluations.append({'Hash': key, 'Result': _dumps(evaluation_result)})
+        if self._shared_evaluations is not None:
+            self._shared_evaluations[key] = evaluation_result
+
+    def _load_shared_evaluations(self) -> None:
+        """Read the whole Eval Cache table into memory for bulk lookups."""
+        try:
+            self._shared_evaluations = {
+                record['fields']['Hash']: _json.loads(record['fields']['Result'])
+                for record in self.eval_cache_table.get_all(fields=EVAL_CACHE_FIELDS)
+                if record['fields'].get('Hash') and record['fields'].get('Result')
+            }
+        except Exception as e:
+            logger.warning(f"Failed to load {EVAL_CACHE_TABLE}: {str(e)}")
+            self._shared_evaluations = {}
+
+    def _get_shared_evaluation(self, compressed_json: str) -> Optional[Dict]:
+        """Return a result from the Eval Cache table, searching it if not preloaded."""
+        key = self._evaluation_cache_key(compressed_json)
+        if self._shared_evaluations is not None:
+            return self._shared_evaluations.get(key)
+        
+        try:
+            records = self.eval_cache_table.search('Hash', key, fields=EVAL_CACHE_FIELDS)
+            if records and records[0]['fields'].get('Result'):
+                return _json.loads(records[0]['fields']['Result'])
+        except Exception as e:
+            logger.warning(f"Failed to search {EVAL_CACHE_TABLE}: {str(e)}")
+        return None
+
+    def _invalidate_records_cache(self) -> None:
+        """Drop cached Applicants reads after writing evaluation results."""
+        self._records_cache = None
+        try:
+            with self._cache_db_lock, self._cache_connection() as conn:
+                conn.execute("DELETE FROM airtable_cache WHERE key = ?", (RECORDS_CACHE_KEY,))
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to clear records cache: {str(e)}")
+
     def get_evaluation_statistics(self) -> Dict:
         """Get statistics about LLM evaluations."""
         try:
-            all_applicants = self.applicants_table.get_all()
+            all_applicants = self._get_all_cached()
             
             total_applicants = len(all_applicants)
-            evaluated_applicants = [a for a in all_applicants if a['fields'].get('LLM Summary')]
-            total_evaluated = len(evaluated_applicants)
+            total_evaluated = 0
+            score_total = 0
+            high_scoring = 0
+            score_counts = Counter()
+            
+            # Single pass over the records for every statistic
+            for applicant in all_applicants:
+                fields = applicant['fields']
+                if not fields.get('LLM Summary'):
+                    continue
+                score = fields.get('LLM Score', 0)
+                total_evaluated += 1
+                score_total += score
+                score_counts[score] += 1
+                if score >= 8:
+                    high_scoring += 1
             
             if total_evaluated == 0:
                 return {
@@ -368,38 +925,38 @@ Follow-Ups:
                     'score_distribution': {}
                 }
             
-            # Calculate score statistics
-            scores = [a['fields'].get('LLM Score', 0) for a in evaluated_applicants]
-            average_score = sum(scores) / len(scores)
-            
-            # Score distribution
-            score_distribution = {}
-            for score in range(1, 11):
-                count = scores.count(score)
-                score_distribution[str(score)] = count
-            
             return {
                 'total_applicants': total_applicants,
                 'total_evaluated': total_evaluated,
                 'evaluation_rate': round(total_evaluated / max(total_applicants, 1) * 100, 1),
-                'average_score': round(average_score, 1),
-                'score_distribution': score_distribution,
-                'high_scoring_candidates': len([s for s in scores if s >= 8])
+                'average_score': round(score_total / total_evaluated, 1),
+                'score_distribution': {str(score): score_counts[score] for score in range(1, 11)},
+                'high_scoring_candidates': high_scoring
             }
             
         except Exception as e:
             logger.error(f"Failed to get evaluation statistics: {str(e)}")
             return {}
 
-def main():
-    """Main execution function."""
+async def run_evaluation() -> Dict:
+    """Evaluate all pending applicants and return the resulting statistics."""
     evaluator = LLMEvaluator()
     
-    # Evaluate all pending applicants
-    evaluator.evaluate_all_pending()
+    try:
+        # Evaluate all pending applicants
+        await evaluator.evaluate_all_pending()
+        
+        return await asyncio.to_thread(evaluator.get_evaluation_statistics)
+    finally:
+        # The HTTP client's connections belong to this event loop, so close
+        # them before asyncio.run() shuts it down
+        await evaluator.aclose()
+
+def main():
+    """Main execution function."""
+    stats = asyncio.run(run_evaluation())
     
     # Print statistics
-    stats = evaluator.get_evaluation_statistics()
     if stats:
         print("\n--- LLM Evaluation Statistics ---")
         print(f"Total Applicants: {stats['total_applicants']}")
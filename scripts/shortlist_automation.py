@@ -9,16 +9,20 @@ rules based on experience, compensation, and location requirements.
 Requirements:
 - airtable-python-wrapper
 - python-dotenv
+- orjson (optional, falls back to ujson or the standard library json)
 - Environment variables: AIRTABLE_API_KEY, AIRTABLE_BASE_ID
 """
 
 import os
-import json
+import re
+import hashlib
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
-from airtable import Airtable
+from compression_script import _json, _month_index, open_table
 
 # Load environment variables
 load_dotenv()
@@ -49,39 +53,101 @@ ALLOWED_LOCATIONS = [
     'India', 'Bangalore', 'Mumbai', 'Delhi', 'Hyderabad', 'Chennai', 'Pune'
 ]
 
+# Each list compiled once into a single lowercase alternation, so a company or
+# location is scanned in one pass instead of one substring check per entry
+TIER_ONE_COMPANY_RE = re.compile('|'.join(re.escape(c.lower()) for c in TIER_ONE_COMPANIES))
+ALLOWED_LOCATION_RE = re.compile('|'.join(re.escape(l.lower()) for l in ALLOWED_LOCATIONS))
+
 MIN_EXPERIENCE_YEARS = 4
 MAX_HOURLY_RATE_USD = 100
 MIN_AVAILABILITY_HOURS = 20
 
+# Shortlist criteria in evaluation order, cheapest first:
+# (criterion, evaluator method, Compressed JSON section, default if missing)
+SHORTLIST_CRITERIA = (
+    ('location', '_evaluate_location', 'personal', dict),
+    ('compensation', '_evaluate_compensation', 'salary', dict),
+    ('experience', '_evaluate_experience', 'experience', list),
+)
+
+# Evaluations kept per run, keyed by a hash of the Compressed JSON, so
+# duplicated applicant profiles are only evaluated once
+EVALUATION_CACHE_SIZE = 4096
+
+# Line template for each criterion in the evaluation summary
+EVALUATION_SUMMARY_LINE = "• %s: %s - %s"
+
+# Narrow projections: evaluation only reads the applicant's JSON, and the
+# statistics only count statuses
+EVALUATION_FIELDS = ['Compressed JSON']
+STATISTICS_FIELDS = ['Shortlist Status']
+LEAD_COUNT_FIELDS = ['Auto Generated']
+
+@lru_cache(maxsize=1024)
+def _is_allowed_location(location: str) -> bool:
+    """Check a lowercased location against ALLOWED_LOCATIONS, memoized since many applicants share one."""
+    return ALLOWED_LOCATION_RE.search(location) is not None
+
 class ShortlistAutomation:
     def __init__(self):
-        self.applicants_table = Airtable(BASE_ID, 'Applicants', API_KEY)
-        self.shortlisted_table = Airtable(BASE_ID, 'Shortlisted Leads', API_KEY)
+        self.applicants_table = open_table('Applicants')
+        self.shortlisted_table = open_table('Shortlisted Leads')
+        self._evaluation_cache: Dict[str, Tuple[str, Dict, str]] = {}
 
     def evaluate_all_applicants(self) -> None:
         """Evaluate all applicants with compressed JSON for shortlisting."""
         try:
             # Find applicants with compressed JSON but no shortlist status
             formula = "AND({Compressed JSON} != '', {Shortlist Status} = '')"
-            pending_applicants = self.applicants_table.get_all(formula=formula)
-            
-            logger.info(f"Found {len(pending_applicants)} applicants to evaluate")
+            pages = self.applicants_table.get_iter(formula=formula, fields=EVALUATION_FIELDS)
             
             shortlisted_count = 0
             rejected_count = 0
             
-            for applicant in pending_applicants:
-                applicant_id = applicant['id']
-                try:
-                    result = self.evaluate_applicant(applicant_id)
-                    if result == 'shortlisted':
+            # One timestamp for the whole run
+            now_iso = datetime.now().isoformat()
+            
+            # Results are collected during the scan and written once it ends, since
+            # setting Shortlist Status while paging a formula on it would shift the
+            # remaining pages and skip applicants
+            pending_writes: List[Tuple[List[Dict], List[Dict]]] = []
+            for page in pages:
+                lead_records = []
+                applicant_updates = []
+                
+                # The scan already returned each record, so evaluation needs no further requests
+                for applicant in page:
+                    applicant_id = applicant['id']
+                    try:
+                        status, update_fields, lead_fields = self._evaluate_record(applicant_id, applicant, now_iso)
+                    except Exception as e:
+                        logger.error(f"Failed to evaluate applicant {applicant_id}: {str(e)}")
+                        rejected_count += 1
+                        continue
+                    
+                    if lead_fields:
+                        lead_records.append(lead_fields)
+                    if update_fields:
+                        applicant_updates.append({'id': applicant_id, 'fields': update_fields})
+                    
+                    if status == 'shortlisted':
                         shortlisted_count += 1
                     else:
                         rejected_count += 1
-                        
+                
+                pending_writes.append((lead_records, applicant_updates))
+                
+                # Progress once per page rather than per applicant
+                logger.info("Progress: %d applicants evaluated (%d shortlisted)",
+                            shortlisted_count + rejected_count, shortlisted_count)
+            
+            # One failed page is logged and left for the next run rather than
+            # aborting the writes for every other page
+            for lead_records, applicant_updates in pending_writes:
+                try:
+                    self._write_results(lead_records, applicant_updates)
                 except Exception as e:
-                    logger.error(f"Failed to evaluate applicant {applicant_id}: {str(e)}")
-                    continue
+                    logger.error(f"Failed to write results for {len(applicant_updates)} applicants: {str(e)}")
             
             logger.info(f"Evaluation complete: {shortlisted_count} shortlisted, {rejected_count} rejected")
             
@@ -89,53 +155,44 @@ class ShortlistAutomation:
             logger.error(f"Failed to evaluate applicants: {str(e)}")
             raise
 
-    def evaluate_applicant(self, applicant_id: str) -> str:
+    def _write_results(self, lead_records: List[Dict], applicant_updates: List[Dict]) -> None:
+        """Write a batch of evaluation results in batched requests."""
+        # Create leads before marking applicants, so a Shortlisted status always has its lead
+        created_leads = self.shortlisted_table.batch_insert(lead_records) if lead_records else []
+        if created_leads:
+            logger.info(f"Created {len(created_leads)} shortlisted leads")
+        if applicant_updates:
+            try:
+                self.applicants_table.batch_update(applicant_updates)
+            except Exception:
+                # The applicants stay unevaluated and are picked up again next
+                # run, so remove their leads rather than leave duplicates behind
+                if created_leads:
+                    self.shortlisted_table.batch_delete([lead['id'] for lead in created_leads])
+                raise
+
+    def evaluate_applicant(self, applicant_id: str, applicant_record: Optional[Dict] = None) -> str:
         """
         Evaluate a single applicant against shortlisting criteria.
         
         Args:
             applicant_id: The Airtable record ID of the applicant
+            applicant_record: The applicant record if the caller already fetched it
             
         Returns:
             'shortlisted' or 'rejected'
         """
         try:
-            logger.info(f"Evaluating applicant {applicant_id}")
-            
-            # Get applicant data
-            applicant_record = self.applicants_table.get(applicant_id)
-            if not applicant_record or 'Compressed JSON' not in applicant_record['fields']:
-                logger.error(f"No compressed JSON found for applicant {applicant_id}")
-                return 'rejected'
-            
-            compressed_data = json.loads(applicant_record['fields']['Compressed JSON'])
+            applicant_record = applicant_record or self.applicants_table.get(applicant_id)
+            status, update_fields, lead_fields = self._evaluate_record(applicant_id, applicant_record)
             
-            # Evaluate against all criteria
-            experience_result, experience_reason = self._evaluate_experience(compressed_data.get('experience', []))
-            compensation_result, compensation_reason = self._evaluate_compensation(compressed_data.get('salary', {}))
-            location_result, location_reason = self._evaluate_location(compressed_data.get('personal', {}))
-            
-            # All criteria must be met for shortlisting
-            if experience_result and compensation_result and location_result:
-                status = 'shortlisted'
-                self._create_shortlisted_lead(applicant_id, compressed_data, {
-                    'experience': experience_reason,
-                    'compensation': compensation_reason,
-                    'location': location_reason
-                })
-            else:
-                status = 'rejected'
+            if lead_fields:
+                self.shortlisted_table.insert(lead_fields)
+                logger.info(f"Created shortlisted lead for applicant {applicant_id}")
             
             # Update applicant status
-            self.applicants_table.update(applicant_id, {
-                'Shortlist Status': status.title(),
-                'Evaluation Date': datetime.now().isoformat(),
-                'Evaluation Reason': self._generate_evaluation_summary({
-                    'experience': (experience_result, experience_reason),
-                    'compensation': (compensation_result, compensation_reason),
-                    'location': (location_result, location_reason)
-                })
-            })
+            if update_fields:
+                self.applicants_table.update(applicant_id, update_fields)
             
             logger.info(f"Applicant {applicant_id} evaluated as: {status}")
             return status
@@ -144,6 +201,75 @@ class ShortlistAutomation:
             logger.error(f"Failed to evaluate applicant {applicant_id}: {str(e)}")
             return 'rejected'
 
+    def _evaluate_record(self, applicant_id: str, applicant_record: Dict,
+                         now_iso: Optional[str] = None) -> Tuple[str, Optional[Dict], Optional[Dict]]:
+        """
+        Evaluate an applicant record against shortlisting criteria without writing anything.
+        
+        Args:
+            now_iso: Evaluation timestamp shared by a batch; defaults to the current time
+        
+        Returns:
+            (status, Applicants update fields, Shortlisted Leads fields or None)
+        """
+        logger.debug("Evaluating applicant %s", applicant_id)
+        now_iso = now_iso or datetime.now().isoformat()
+        
+        if not applicant_record or 'Compressed JSON' not in applicant_record['fields']:
+            logger.error(f"No compressed JSON found for applicant {applicant_id}")
+            return 'rejected', None, None
+        
+        compressed_json = applicant_record['fields']['Compressed JSON']
+        cache_key = self._cache_key(compressed_json)
+        cached = self._evaluation_cache.get(cache_key)
+        compressed_data = None
+        
+        if cached:
+            # Identical profile already evaluated this run
+            status, results, summary = cached
+        else:
+            compressed_data = _json.loads(compressed_json)
+            
+            # Stop at the first failure, since all criteria must be met for shortlisting
+            results = {}
+            for criterion, evaluator, section, default in SHORTLIST_CRITERIA:
+                results[criterion] = getattr(self, evaluator)(compressed_data.get(section, default()))
+                if not results[criterion][0]:
+                    status = 'rejected'
+                    break
+            else:
+                status = 'shortlisted'
+            
+            summary = self._generate_evaluation_summary(results)
+            self._remember_evaluation(cache_key, (status, results, summary))
+        
+        lead_fields = None
+        if status == 'shortlisted':
+            # The lead quotes the applicant's own details, so only its JSON is needed here
+            compressed_data = compressed_data or _json.loads(compressed_json)
+            lead_fields = self._build_shortlisted_lead(applicant_id, compressed_json, compressed_data, {
+                criterion: reason for criterion, (_, reason) in results.items()
+            }, now_iso)
+        
+        update_fields = {
+            'Shortlist Status': status.title(),
+            'Evaluation Date': now_iso,
+            'Evaluation Reason': summary
+        }
+        
+        logger.debug("Applicant %s evaluated as: %s", applicant_id, status)
+        return status, update_fields, lead_fields
+
+    def _cache_key(self, compressed_json: str) -> str:
+        """Hash a Compressed JSON string for the evaluation cache."""
+        return hashlib.blake2b(compressed_json.encode(), digest_size=16).hexdigest()
+
+    def _remember_evaluation(self, cache_key: str, evaluation: Tuple[str, Dict, str]) -> None:
+        """Cache an evaluation, dropping the oldest entry once the cache is full."""
+        if len(self._evaluation_cache) >= EVALUATION_CACHE_SIZE:
+            self._evaluation_cache.pop(next(iter(self._evaluation_cache)))
+        self._evaluation_cache[cache_key] = evaluation
+
     def _evaluate_experience(self, experience_data: List[Dict]) -> Tuple[bool, str]:
         """
         Evaluate experience criteria: ≥4 years total OR worked at Tier-1 company.
@@ -156,13 +282,8 @@ class ShortlistAutomation:
             total_years = self._calculate_total_experience(experience_data)
             
             # Check for Tier-1 company experience
-            tier_one_companies = []
-            for exp in experience_data:
-                company = exp.get('company', '').lower()
-                for tier_one in TIER_ONE_COMPANIES:
-                    if tier_one.lower() in company:
-                        tier_one_companies.append(exp.get('company', ''))
-                        break
+            tier_one_companies = [exp.get('company', '') for exp in experience_data
+                                  if TIER_ONE_COMPANY_RE.search(exp.get('company', '').lower())]
             
             # Evaluate criteria
             if total_years >= MIN_EXPERIENCE_YEARS:
@@ -226,10 +347,9 @@ class ShortlistAutomation:
             location = personal_data.get('location', '').lower()
             
             # Check against allowed locations
-            for allowed in ALLOWED_LOCATIONS:
-                if allowed.lower() in location:
-                    reason = f"Location: {personal_data.get('location', '')} (allowed region)"
-                    return True, reason
+            if _is_allowed_location(location):
+                reason = f"Location: {personal_data.get('location', '')} (allowed region)"
+                return True, reason
             
             reason = f"Location: {personal_data.get('location', '')} (not in allowed regions)"
             return False, reason
@@ -241,6 +361,8 @@ class ShortlistAutomation:
     def _calculate_total_experience(self, experience_data: List[Dict]) -> float:
         """Calculate total years of experience from experience records."""
         total_months = 0
+        today = datetime.now()
+        now_month = today.year * 12 + today.month
         
         for exp in experience_data:
             try:
@@ -251,18 +373,17 @@ class ShortlistAutomation:
                 if not start_date:
                     continue
                 
-                start = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+                start = _month_index(start_date)
                 
                 if is_current:
-                    end = datetime.now()
+                    end = now_month
                 elif end_date:
-                    end = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+                    end = _month_index(end_date)
                 else:
                     continue
                 
                 # Calculate months of experience
-                months = (end.year - start.year) * 12 + (end.month - start.month)
-                total_months += max(0, months)
+                total_months += max(0, end - start)
                 
             except Exception as e:
                 logger.warning(f"Failed to parse experience dates: {str(e)}")
@@ -270,73 +391,67 @@ class ShortlistAutomation:
         
         return round(total_months / 12, 1)
 
-    def _create_shortlisted_lead(self, applicant_id: str, compressed_data: Dict, reasons: Dict) -> None:
-        """Create a record in the Shortlisted Leads table."""
-        try:
-            score_reason = self._generate_shortlist_reason(compressed_data, reasons)
-            
-            self.shortlisted_table.create({
-                'Applicant': [applicant_id],
-                'Compressed JSON': json.dumps(compressed_data, indent=2),
-                'Score Reason': score_reason,
-                'Created At': datetime.now().isoformat(),
-                'Auto Generated': True
-            })
-            
-            logger.info(f"Created shortlisted lead for applicant {applicant_id}")
-            
-        except Exception as e:
-            logger.error(f"Failed to create shortlisted lead: {str(e)}")
-            raise
+    def _build_shortlisted_lead(self, applicant_id: str, compressed_json: str, compressed_data: Dict,
+                                reasons: Dict, now_iso: str) -> Dict:
+        """Build the fields for a Shortlisted Leads record, copying the applicant's stored JSON as-is."""
+        score_reason = self._generate_shortlist_reason(compressed_data, reasons, now_iso)
+        
+        return {
+            'Applicant': [applicant_id],
+            'Compressed JSON': compressed_json,
+            'Score Reason': score_reason,
+            'Created At': now_iso,
+            'Auto Generated': True
+        }
 
-    def _generate_shortlist_reason(self, compressed_data: Dict, reasons: Dict) -> str:
+    def _generate_shortlist_reason(self, compressed_data: Dict, reasons: Dict, now_iso: str) -> str:
         """Generate a human-readable reason for shortlisting."""
         personal = compressed_data.get('personal', {})
         salary = compressed_data.get('salary', {})
         
-        reason_parts = [
-            f"Candidate: {personal.get('name', 'Unknown')}",
-            f"Location: {personal.get('location', 'Unknown')}",
-            f"Rate: ${salary.get('preferred_rate', 0)}/hr {salary.get('currency', 'USD')}",
-            f"Availability: {salary.get('availability', 0)} hrs/week",
-            "",
-            "Qualification Details:",
-            f"• Experience: {reasons.get('experience', 'Not evaluated')}",
-            f"• Compensation: {reasons.get('compensation', 'Not evaluated')}",
-            f"• Location: {reasons.get('location', 'Not evaluated')}",
-            "",
-            f"Auto-shortlisted on {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}"
-        ]
-        
-        return "\n".join(reason_parts)
+        # Every line is known up front, so format one literal rather than joining a list.
+        # The first 19 characters of an ISO timestamp are YYYY-MM-DDTHH:MM:SS.
+        return (
+            f"Candidate: {personal.get('name', 'Unknown')}\n"
+            f"Location: {personal.get('location', 'Unknown')}\n"
+            f"Rate: ${salary.get('preferred_rate', 0)}/hr {salary.get('currency', 'USD')}\n"
+            f"Availability: {salary.get('availability', 0)} hrs/week\n"
+            "\n"
+            "Qualification Details:\n"
+            f"• Experience: {reasons.get('experience', 'Not evaluated')}\n"
+            f"• Compensation: {reasons.get('compensation', 'Not evaluated')}\n"
+            f"• Location: {reasons.get('location', 'Not evaluated')}\n"
+            "\n"
+            f"Auto-shortlisted on {now_iso[:19].replace('T', ' ')} UTC"
+        )
 
     def _generate_evaluation_summary(self, results: Dict) -> str:
         """Generate a summary of the evaluation results."""
-        summary_parts = ["Evaluation Summary:"]
-        
-        for criterion, (passed, reason) in results.items():
-            status = "✓ PASS" if passed else "✗ FAIL"
-            summary_parts.append(f"• {criterion.title()}: {status} - {reason}")
+        criteria_lines = "\n".join(
+            EVALUATION_SUMMARY_LINE % (criterion.title(), "✓ PASS" if passed else "✗ FAIL", reason)
+            for criterion, (passed, reason) in results.items()
+        )
         
         all_passed = all(result[0] for result in results.values())
         final_status = "SHORTLISTED" if all_passed else "REJECTED"
-        summary_parts.append(f"\nFinal Status: {final_status}")
         
-        return "\n".join(summary_parts)
+        return f"Evaluation Summary:\n{criteria_lines}\n\nFinal Status: {final_status}"
 
     def get_shortlist_statistics(self) -> Dict:
         """Get statistics about shortlisting results."""
         try:
-            all_applicants = self.applicants_table.get_all()
-            shortlisted_leads = self.shortlisted_table.get_all()
+            # Only the status column is needed to count applicants, and any
+            # single narrow column is enough to count leads. Pages are counted
+            # as they stream in rather than collected.
+            status_counts = Counter()
+            for page in self.applicants_table.get_iter(fields=STATISTICS_FIELDS):
+                status_counts.update(a['fields'].get('Shortlist Status') for a in page)
+            leads_created = sum(len(page) for page in self.shortlisted_table.get_iter(fields=LEAD_COUNT_FIELDS))
             
-            total_applicants = len(all_applicants)
-            total_evaluated = len([a for a in all_applicants 
-                                 if a['fields'].get('Shortlist Status')])
-            total_shortlisted = len([a for a in all_applicants 
-                                   if a['fields'].get('Shortlist Status') == 'Shortlisted'])
-            total_rejected = len([a for a in all_applicants 
-                                if a['fields'].get('Shortlist Status') == 'Rejected'])
+            total_applicants = sum(status_counts.values())
+            total_evaluated = total_applicants - status_counts[None] - status_counts['']
+            total_shortlisted = status_counts['Shortlisted']
+            total_rejected = status_counts['Rejected']
             
             return {
                 'total_applicants': total_applicants,
@@ -344,7 +459,7 @@ class ShortlistAutomation:
                 'total_shortlisted': total_shortlisted,
                 'total_rejected': total_rejected,
                 'shortlist_rate': round(total_shortlisted / max(total_evaluated, 1) * 100, 1),
-                'leads_created': len(shortlisted_leads)
+                'leads_created': leads_created
             }
             
         except Exception as e: